@@ -1,61 +1,74 @@
+import time
+
+# Taken before anything else is imported, so startup timings include the imports
+STARTUP_T0 = time.perf_counter()
+
+import importlib
+import os
+import threading
 import tkinter as tk
-from tkinter import messagebox, filedialog
-from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
-import matplotlib.pyplot as plt
-import numpy as np
-import ast
+from tkinter import messagebox, filedialog, simpledialog, ttk
+
+# Cold-start targets: the window paints first, the heavy modules load behind it
+FIRST_PAINT_TARGET_MS = 300
+READY_TARGET_MS = 1500
+
+# numpy, matplotlib and the analysis code take over a second to import, so they are
+# loaded on a background thread after the window is on screen (see load_modules)
+HEAVY_MODULES = (
+    "numpy",
+    "matplotlib.figure",
+    "matplotlib.backends.backend_tkagg",
+    "regression",
+    "regression.cache",
+    "regression.diagnostics",
+    "regression.export",
+    "regression.figures",
+    "regression.live",
+    "regression.plotting",
+    "regression.profiling",
+    "regression.resampling",
+    "regression.robust",
+    "regression.rolling",
+    "regression.worker",
+    "gui",
+)
+
+# Created by finish_startup once the heavy modules are loaded
+result_cache = None
+runner = None
+export_runner = None
+regression_plot = None
+data_table = None
+canvas = None
 
-def parse_input_data(data_str):
-    try:
-        return ast.literal_eval(data_str)
-    except Exception as e:
-        messagebox.showerror("Data Error", f"Invalid data format:\n{e}")
-        return []
+# Data of the fit on screen, its polynomial coefficients (β₀, β₁, ...) of
+# t = (x - center) / scale, center and scale, for exporting fitted values and statistics
+last_fit = None
 
-def compute_and_plot(data):
-    global canvas
+# Ordinary least squares, or one of the robust estimators in regression.robust
+LEAST_SQUARES = "least squares"
 
-    try:
-        ax.clear()
-
-        x_vals = [point[0] for point in data]
-        y_vals = [point[1] for point in data]
-        x_squared = [x**2 for x in x_vals]
-        y_squared = [y**2 for y in y_vals]
-        xy_products = [x*y for x, y in zip(x_vals, y_vals)]
-
-        n = len(data)
-        sum_x = sum(x_vals)
-        sum_y = sum(y_vals)
-        sum_x2 = sum(x_squared)
-        sum_y2 = sum(y_squared)
-        sum_xy = sum(xy_products)
-
-        # Calculate slope (b) and intercept (a) using formulas
-        b_numerator = n * sum_xy - sum_x * sum_y
-        b_denominator = n * sum_x2 - sum_x**2
-        b = b_numerator / b_denominator if b_denominator != 0 else 0
-        a = (sum_y - b * sum_x) / n if n != 0 else 0
-
-        y_fit = [b * x + a for x in x_vals]
-        ax.plot(x_vals, y_fit, color='red', label=f"Best Fit Line: y = {b:.3f}x + {a:.3f}")
-
-        ax.scatter(x_vals, y_vals, color='blue', s=100, label='Data Points')
-
-        ax.set_title("Linear Regression: y = a + bx", fontsize=22)
-        ax.set_xlabel("x", fontsize=18)
-        ax.set_ylabel("y", fontsize=18)
-        ax.grid(True)
-        ax.legend()
-
-        canvas.draw()
-
-        table_text = "x\t y\t x²\t y²\t xy\n"
-        for x, y, x2, y2, xy in zip(x_vals, y_vals, x_squared, y_squared, xy_products):
-            table_text += f"{x}\t {y}\t {x2}\t {y2}\t {xy}\n"
-        table_label.config(text=table_text)
-
-        summary_text = f"""
+# Bootstrap resamples and permutations behind the "± CI" option
+INTERVAL_RESAMPLES = 2000
+
+# Live data source while live mode is on, and its redraw interval (20 frames/s)
+live_session = None
+LIVE_FRAME_MS = 50
+
+# Above this many points the scatter switches to a density image in "auto" mode
+MAX_SCATTER_POINTS = None
+
+def format_summary(result):
+    n = result.n
+    sum_x = result.sum_x
+    sum_y = result.sum_y
+    sum_x2 = result.sum_x2
+    sum_xy = result.sum_xy
+    b = result.slope
+    a = result.intercept
+
+    return f"""
 Step 1: Compute necessary values
 n = {n}
 Σx = {sum_x}
@@ -73,42 +86,539 @@ a = [Σy - bΣx] / n
 a = [{sum_y} - {b:.4f}*{sum_x}] / {n}
 a = {a:.4f}
 """
-        summary_label.config(text=summary_text)
 
-        interpretation_label.config(
-            text=f"Resulting Line Equation:\n\ny = {a:.4f} + {b:.4f}x"
-        )
+def format_matrix_summary(poly):
+    degree = poly.coefficients.size - 1
+    with np.printoptions(precision=4, suppress=True, linewidth=60):
+        xtx_text = str(poly.xtx)
+        xty_text = str(poly.xty)
+        gamma_text = str(poly.coefficients)
+        beta_text = str(expand_polynomial(poly.coefficients, poly.center, poly.scale))
+
+    return f"""
+Step 1: Build the normal equations
+X = [1, t, t², ...] with t = (x - {poly.center:.4g}) / {poly.scale:.4g}
+n = {poly.n}, degree = {degree}
+XᵀX =
+{xtx_text}
+Xᵀy =
+{xty_text}
+
+Step 2: Solve (XᵀX)β = Xᵀy
+Cholesky factorisation XᵀX = LLᵀ,
+then Lz = Xᵀy and Lᵀβ = z
+β (in t) = {gamma_text}
+
+Step 3: Expand to powers of x (for display; the curve is evaluated in t)
+β = {beta_text}
+R² = {poly.r_squared:.4f}
+"""
+
+def format_robust_summary(robust, result):
+    return f"""
+Robust fit: {robust.method}
+n = {robust.n}
+b = {robust.slope:.4f}
+a = {robust.intercept:.4f}
+Robust σ of residuals = {robust.scale:.4g}
+Inliers = {robust.inliers} of {robust.n}
+
+Least squares, for comparison:
+b = {result.slope:.4f}, a = {result.intercept:.4f}
+"""
+
+def format_intervals(ci):
+    level = f"{100 * ci.confidence:g}%"
+    return f"""
+{level} bootstrap intervals ({ci.resamples} resamples):
+b ∈ [{ci.slope_ci[0]:.4f}, {ci.slope_ci[1]:.4f}]  p = {ci.slope_p:.4g}
+a ∈ [{ci.intercept_ci[0]:.4f}, {ci.intercept_ci[1]:.4f}]  p = {ci.intercept_p:.4g}
+r ∈ [{ci.r_ci[0]:.4f}, {ci.r_ci[1]:.4f}]  p = {ci.r_p:.4g}
+(p for b and r: permutation test; for a: bootstrap)
+"""
+
+def analyze_input(data_str, degree, fit_mode, intervals, timer, report):
+    # Runs on the worker thread, so nothing here may touch Tk or the figure
+    robust = fit_mode != LEAST_SQUARES
+    if robust and degree > 1:
+        raise ValueError("Robust fits are straight lines; set Degree to 1.")
+    # Intervals are resampled for the least-squares line only
+    intervals = intervals and not robust and degree == 1
+    with timer.stage("cache"):
+        params = ("pairs", degree, fit_mode) if robust else ("pairs", degree)
+        if intervals:
+            params += ("intervals", INTERVAL_RESAMPLES)
+        key = content_key(data_str, *params)
+        cached = result_cache.get(key)
+    if cached is not None:
+        return cached
+
+    with timer.stage("parse"):
+        x_vals, y_vals = parse_pairs(data_str, progress=lambda done: report(0.6 * done))
+    if x_vals.size == 0:
+        return None
+    report(0.6)
+    with timer.stage("compute"):
+        # Large datasets are reduced on all cores (REGRESSION_WORKERS overrides the count)
+        result = parallel_fit(x_vals, y_vals)
+        poly = fit_polynomial(x_vals, y_vals, degree) if degree > 1 else None
+        line = robust_fit(x_vals, y_vals, fit_mode) if robust else None
+    ci = None
+    if intervals and x_vals.size >= 3:
+        with timer.stage("resample"):
+            ci = confidence_intervals(x_vals, y_vals, INTERVAL_RESAMPLES,
+                                      progress=lambda done: report(0.6 + 0.2 * done))
+    with timer.stage("summary"):
+        if line is not None:
+            summary_text = format_robust_summary(line, result)
+            # r and the sums still describe the data; the line is the robust one
+            result = result._replace(slope=line.slope, intercept=line.intercept)
+        elif poly is not None:
+            summary_text = format_matrix_summary(poly)
+        else:
+            summary_text = format_summary(result)
+        if ci is not None:
+            summary_text += format_intervals(ci)
+    report(0.8)
+    analysis = x_vals, y_vals, result, poly, summary_text
+    result_cache.put(key, analysis)
+    return analysis
+
+def compute_and_plot(x_vals, y_vals, result, poly=None):
+    curve = None
+    if poly is not None:
+        x_line = np.linspace(x_vals.min(), x_vals.max(), 200)
+        # Evaluated in t; powers of x are only for the label
+        expanded = expand_polynomial(poly.coefficients, poly.center, poly.scale)
+        curve = (x_line, predict_polynomial(poly.coefficients, x_line, poly.center, poly.scale),
+                 f"Best Fit Curve: {polynomial_equation(expanded, 3)}")
+
+    # Only the data of the existing artists changes; no ax.clear()
+    regression_plot.update(x_vals, y_vals, result, mode=render_mode.get(),
+                           scatter_limit=MAX_SCATTER_POINTS, curve=curve)
+
+def show_results(analysis, timer=None):
+    global last_fit
+
+    timer = timer or StageTimer()
+    progress_bar["value"] = 100
+    if analysis is None:
+        return
+    x_vals, y_vals, result, poly, summary_text = analysis
+    if poly is not None:
+        last_fit = x_vals, y_vals, poly.coefficients, poly.center, poly.scale
+    else:
+        last_fit = x_vals, y_vals, (result.intercept, result.slope), 0.0, 1.0
 
+    try:
+        with timer.stage("plot"):
+            compute_and_plot(x_vals, y_vals, result, poly)
+            # Run the pending draw now so it is counted in this stage
+            canvas.get_tk_widget().update_idletasks()
     except Exception as e:
         messagebox.showerror("Error", str(e))
+        return
+
+    with timer.stage("table"):
+        data_table.set_data(x_vals, y_vals)
+        summary_label.config(text=summary_text)
+        if poly is not None:
+            interpretation_label.config(
+                text=f"Resulting Curve Equation:\n\n{polynomial_equation(expand_polynomial(poly.coefficients, poly.center, poly.scale))}\n\nR² = {poly.r_squared:.4f}"
+            )
+        else:
+            interpretation_label.config(
+                text=f"Resulting Line Equation:\n\ny = {result.intercept:.4f} + {result.slope:.4f}x\n\nr = {result.r:.4f}"
+            )
+
+    show_timings(timer)
+
+def show_timings(timer):
+    # REGRESSION_PROFILE=<file> writes a cProfile of the last run there
+    profile_path = timer.dump_profile()
+    if show_timings_var.get():
+        text = timer.summary()
+        if profile_path:
+            text += f" · profile: {profile_path}"
+        status_label.config(text=text)
+
+def show_error(error):
+    progress_bar["value"] = 0
+    if isinstance(error, ParseError):
+        messagebox.showerror("Data Error", f"Invalid data format:\n{error}")
+    else:
+        messagebox.showerror("Error", str(error))
+
+def show_progress(fraction):
+    progress_bar["value"] = 100 * fraction
 
 def load_data_and_plot():
     data_str = input_box.get("1.0", tk.END).strip()
-    data = parse_input_data(data_str)
-    if data:
-        compute_and_plot(data)
+    progress_bar["value"] = 0
+    timer = StageTimer()
+    # Submitting again cancels a run that is still in progress
+    runner.submit(analyze_input, data_str, int(degree_var.get()), fit_mode.get(),
+                  intervals_var.get(), timer,
+                  on_done=lambda analysis: show_results(analysis, timer),
+                  on_error=show_error, on_progress=show_progress)
+
+def analyze_groups(path, report):
+    with open(path, "rb") as f:
+        key = content_key(f.read(), "groups")
+    cached = result_cache.get(key)
+    if cached is not None:
+        return (path,) + cached
+
+    x_vals, y_vals, groups = load_grouped(path)
+    report(0.5)
+    keys, codes = group_codes(groups)
+    grouped = fit_codes(x_vals, y_vals, keys, codes)
+    report(0.8)
+    order, bounds = group_members(codes, keys.size)
+    analysis = x_vals, y_vals, grouped, order, bounds
+    result_cache.put(key, analysis)
+    return (path,) + analysis
+
+def show_groups(analysis):
+    progress_bar["value"] = 100
+    path, x_vals, y_vals, grouped, order, bounds = analysis
+
+    def show_group(index):
+        members = order[bounds[index]:bounds[index + 1]]
+        x_group = x_vals[members]
+        y_group = y_vals[members]
+        # Centred like the group list (and analyze_input), so both show the same fit
+        result = parallel_fit(x_group, y_group)
+        show_results((x_group, y_group, result, None, format_summary(result)))
+
+    GroupBrowser(root, grouped, show_group, title=os.path.basename(path))
+
+def open_groups():
+    file_path = filedialog.askopenfilename(filetypes=[("Data files", "*.csv *.tsv *.txt *.dat"),
+                                                      ("All files", "*.*")])
+    if file_path:
+        progress_bar["value"] = 0
+        runner.submit(analyze_groups, file_path,
+                      on_done=show_groups, on_error=show_error, on_progress=show_progress)
+
+def analyze_rolling(x_vals, y_vals, window, report):
+    report(0.2)
+    return rolling_fit(x_vals, y_vals, window)
+
+def write_rolling(rolling, path, report):
+    rolling.save(path)
+    return [path]
+
+def save_rolling(rolling, path):
+    # Millions of windows at full precision take a while to format
+    export_runner.submit(write_rolling, rolling, path,
+                         on_done=saved, on_error=show_error, on_progress=show_export_progress)
+
+def show_rolling(rolling):
+    progress_bar["value"] = 100
+    RollingWindow(root, rolling, save_rolling)
+
+def open_rolling():
+    if last_fit is None:
+        messagebox.showerror("Error", "Nothing has been analyzed yet.")
+        return
+    x_vals, y_vals = last_fit[:2]
+    if x_vals.size < 2:
+        messagebox.showerror("Error", "A rolling fit needs at least two points.")
+        return
+    # Windows follow the input order, so the data should be time-ordered
+    window = simpledialog.askinteger("Rolling fit", "Points per window:", parent=root,
+                                     initialvalue=max(2, min(100, x_vals.size // 10)),
+                                     minvalue=2, maxvalue=x_vals.size)
+    if window:
+        progress_bar["value"] = 0
+        runner.submit(analyze_rolling, x_vals, y_vals, window,
+                      on_done=show_rolling, on_error=show_error, on_progress=show_progress)
+
+def analyze_diagnostics(x_vals, y_vals, report):
+    report(0.2)
+    return x_vals, y_vals, diagnose(x_vals, y_vals)
+
+def show_diagnostics(analysis):
+    progress_bar["value"] = 100
+    x_vals, y_vals, diagnostics = analysis
+    DiagnosticsWindow(root, x_vals, y_vals, diagnostics, mode=render_mode.get(),
+                      scatter_limit=MAX_SCATTER_POINTS)
+
+def open_diagnostics():
+    if last_fit is None:
+        messagebox.showerror("Error", "Nothing has been analyzed yet.")
+        return
+    # Diagnostics are for the least-squares line, whatever degree or fit is on screen
+    x_vals, y_vals = last_fit[:2]
+    progress_bar["value"] = 0
+    runner.submit(analyze_diagnostics, x_vals, y_vals,
+                  on_done=show_diagnostics, on_error=show_error, on_progress=show_progress)
+
+def live_frame():
+    # Only the points that arrived since the previous frame are parsed and summed
+    if live_session is None:
+        return
+    try:
+        added = live_session.update()
+    except Exception as e:
+        stop_live()
+        show_error(e)
+        return
+    if added and len(live_session.fit) >= 2:
+        result = live_session.result()
+        x_shown, y_shown = live_session.points.tail(LIVE_DISPLAY_POINTS)
+        regression_plot.update(x_shown, y_shown, result, mode=render_mode.get(),
+                               scatter_limit=MAX_SCATTER_POINTS, rescale="grow")
+        summary_label.config(text=format_summary(result))
+        interpretation_label.config(
+            text=f"Live: {result.n:,} points\n\ny = {result.intercept:.4f} + {result.slope:.4f}x\n\nr = {result.r:.4f}"
+        )
+    root.after(LIVE_FRAME_MS, live_frame)
+
+def stop_live():
+    global live_session
+    session, live_session = live_session, None
+    live_button.config(text="📡 Live")
+    session.stop()
+    if len(session.fit) >= 2:
+        # Leave the whole stream on screen, in the table and ready for export
+        x_vals, y_vals = session.points.arrays()
+        result = session.result()
+        show_results((x_vals.copy(), y_vals.copy(), result, None, format_summary(result)))
+
+def toggle_live():
+    global live_session
+    if live_session is not None:
+        stop_live()
+        return
+    source = simpledialog.askstring("Live data", "Source: file:PATH, tcp:[HOST:]PORT or unix:PATH",
+                                    parent=root, initialvalue="tcp:5555")
+    if not source:
+        return
+    try:
+        live_session = LiveSession(source).start()
+    except (OSError, ValueError) as e:
+        messagebox.showerror("Error", f"Could not open {source}:\n{e}")
+        return
+    live_button.config(text="⏹ Stop Live")
+    live_frame()
+
+def poll_worker():
+    # Callbacks open windows and can raise; polling must go on for later jobs
+    try:
+        runner.poll()
+        export_runner.poll()
+    finally:
+        root.after(50, poll_worker)
+
+def warm_imports(errors):
+    # Runs on a background thread; importing fills sys.modules for load_modules
+    try:
+        for name in HEAVY_MODULES:
+            importlib.import_module(name)
+    except Exception as e:
+        errors.append(e)
+
+def load_modules():
+    # Binds the heavy imports as globals; instant once warm_imports has run
+    global np, Figure, FigureCanvasTkAgg, DiagnosticsWindow, GroupBrowser, RollingWindow, VirtualTable
+    global ParseError, parse_pairs, ResultCache, content_key, EXPORT_FORMATS, export_fit
+    global fit_codes, group_codes, group_members, load_grouped, parallel_fit, StageTimer
+    global SufficientStats, fit_polynomial, polynomial_equation, predict_polynomial, expand_polynomial
+    global ROBUST_METHODS, robust_fit, confidence_intervals, rolling_fit
+    global LIVE_DISPLAY_POINTS, LiveSession, diagnose
+    global batch_paths, save_figures, snapshot_figure
+    global default_scatter_limit, RENDER_MODES, RegressionPlot, BackgroundRunner
+    import numpy as np
+    from matplotlib.figure import Figure
+    from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+
+    from gui import DiagnosticsWindow, GroupBrowser, RollingWindow, VirtualTable
+    from regression import ParseError, parse_pairs
+    from regression.cache import ResultCache, content_key
+    from regression.diagnostics import diagnose
+    from regression.export import EXPORT_FORMATS, export_fit
+    from regression.figures import batch_paths, save_figures, snapshot_figure
+    from regression.grouped import fit_codes, group_codes, group_members, load_grouped
+    from regression.live import DISPLAY_POINTS as LIVE_DISPLAY_POINTS, LiveSession
+    from regression.parallel import parallel_fit
+    from regression.profiling import StageTimer
+    from regression.resampling import confidence_intervals
+    from regression.robust import ROBUST_METHODS, robust_fit
+    from regression.rolling import rolling_fit
+    from regression.summary import SufficientStats
+    from regression.multiple import (expand_polynomial, fit_polynomial, polynomial_equation,
+                                     predict_polynomial)
+    from regression.plotting import RENDER_MODES, RegressionPlot, default_scatter_limit
+    from regression.worker import BackgroundRunner
+
+def wait_for_modules(loader, errors):
+    if loader.is_alive():
+        root.after(20, wait_for_modules, loader, errors)
+    elif errors:
+        messagebox.showerror("Error", f"Could not load the analysis modules:\n{errors[0]}")
+    else:
+        finish_startup()
+
+def finish_startup():
+    global result_cache, runner, export_runner, regression_plot, data_table, canvas, MAX_SCATTER_POINTS
+
+    load_modules()
+    # Set REGRESSION_SCATTER_LIMIT to move the switch to a density image
+    MAX_SCATTER_POINTS = default_scatter_limit()
+    # Set REGRESSION_CACHE_DIR to keep analyses on disk between sessions
+    result_cache = ResultCache(directory=os.environ.get("REGRESSION_CACHE_DIR"))
+    # Parsing and fitting run on a worker thread; results come back through poll_worker
+    runner = BackgroundRunner()
+    # Saving runs alongside analyses and other saves; none of them cancels another
+    export_runner = BackgroundRunner(exclusive=False)
+
+    # A bare Figure avoids importing pyplot and its backend selection
+    fig = Figure(figsize=(7, 5))
+    ax = fig.add_subplot()
+    plot_placeholder.destroy()
+    canvas = FigureCanvasTkAgg(fig, master=left_panel)
+    canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+    regression_plot = RegressionPlot(ax, canvas, color='blue', size=100, label='Data Points')
+
+    table_placeholder.destroy()
+    data_table = VirtualTable(right_panel, height=12, font=("Courier", 16), bg="#f0f6ff")
+    data_table.pack(pady=(0, 10), padx=5, fill=tk.X, before=summary_label)
+
+    fill_menu(render_menu, render_mode, RENDER_MODES)
+    fill_menu(fit_menu, fit_mode, (LEAST_SQUARES,) + ROBUST_METHODS)
+    for button in analysis_buttons:
+        button.config(state=tk.NORMAL)
+
+    root.update_idletasks()
+    report_startup((time.perf_counter() - STARTUP_T0) * 1000)
+
+    poll_worker()
+    load_data_and_plot()
+
+def fill_menu(option_menu, variable, values):
+    menu = option_menu["menu"]
+    menu.delete(0, tk.END)
+    for value in values:
+        menu.add_command(label=value, command=tk._setit(variable, value))
+    option_menu.config(state=tk.NORMAL)
+
+def report_startup(ready_ms):
+    text = (f"startup: window {first_paint_ms:.0f} ms (target {FIRST_PAINT_TARGET_MS}) · "
+            f"ready {ready_ms:.0f} ms (target {READY_TARGET_MS})")
+    if os.environ.get("REGRESSION_STARTUP_REPORT"):
+        # Used by benchmarks/startup.py: print the timings and quit
+        print(f"{first_paint_ms:.1f} {ready_ms:.1f}", flush=True)
+        root.after_idle(exit_app)
+    elif show_timings_var.get():
+        status_label.config(text=text)
+
+def render_figures(snapshots, paths, report):
+    return save_figures(snapshots, paths, progress=report)
+
+def write_report(path, lines, summary, interpretation, report):
+    with open(path, "w") as f:
+        f.writelines(lines)
+        f.write("\n")
+        f.write(summary)
+        f.write("\n")
+        f.write(interpretation)
+    return [path]
+
+def write_summary(path, x_vals, y_vals, degree, report):
+    SufficientStats.from_arrays(x_vals, y_vals, degree).save(path)
+    return [path]
+
+def export_all(directory, names, snapshots, lines, summary, interpretation, report):
+    paths = render_figures(snapshots, batch_paths(directory, names), report)
+    return paths + write_report(os.path.join(directory, "report.txt"), lines, summary,
+                                interpretation, report)
+
+def show_export_progress(fraction):
+    status_label.config(text=f"Saving… {fraction:.0%}")
+
+def saved(paths):
+    status_label.config(text=f"Saved {len(paths)} file{'s' if len(paths) > 1 else ''}")
+    messagebox.showinfo("Saved", "Saved:\n" + "\n".join(paths))
 
 def save_plot():
     file_path = filedialog.asksaveasfilename(defaultextension=".png",
-                                             filetypes=[("PNG files", "*.png")])
+                                             filetypes=[("PNG files", "*.png"),
+                                                        ("SVG files", "*.svg"),
+                                                        ("PDF files", "*.pdf")])
     if file_path:
-        fig.savefig(file_path)
-        messagebox.showinfo("Saved", f"Plot saved to:\n{file_path}")
+        # Only the snapshot is taken here; rendering happens on the export worker
+        export_runner.submit(render_figures, [snapshot_figure(canvas.figure)], [[file_path]],
+                             on_done=saved, on_error=show_error, on_progress=show_export_progress)
+
+def save_all():
+    directory = filedialog.askdirectory(title="Save every figure and the report to")
+    if not directory:
+        return
+    # The main plot plus every open rolling-fit and diagnostics window
+    names = ["plot"]
+    figures = [canvas.figure]
+    for window in root.winfo_children():
+        if isinstance(window, (RollingWindow, DiagnosticsWindow)):
+            kind = "rolling" if isinstance(window, RollingWindow) else "diagnostics"
+            names.append(f"{kind}-{len(names)}")
+            figures.append(window.figure)
+    export_runner.submit(export_all, directory, names, [snapshot_figure(f) for f in figures],
+                         data_table.iter_lines(), summary_label.cget("text"),
+                         interpretation_label.cget("text"),
+                         on_done=saved, on_error=show_error, on_progress=show_export_progress)
 
 def save_data():
     file_path = filedialog.asksaveasfilename(defaultextension=".txt",
-                                             filetypes=[("Text files", "*.txt")])
+                                             filetypes=[("Text files", "*.txt"),
+                                                        ("Regression summary (JSON)", "*.json"),
+                                                        ("Regression summary (binary)", "*.npz")])
+    if not file_path:
+        return
+    if file_path.lower().endswith((".json", ".npz")):
+        # Sufficient statistics that python -m regression.merge can merge with other runs;
+        # a polynomial fit also stores its cross-products
+        if last_fit is None:
+            messagebox.showerror("Error", "Nothing has been analyzed yet.")
+            return
+        x_vals, y_vals, coefficients = last_fit[:3]
+        export_runner.submit(write_summary, file_path, x_vals, y_vals, len(coefficients) - 1,
+                             on_done=saved, on_error=show_error, on_progress=show_export_progress)
+        return
+    # The table rows are formatted and written on the export worker
+    export_runner.submit(write_report, file_path, data_table.iter_lines(),
+                         summary_label.cget("text"), interpretation_label.cget("text"),
+                         on_done=saved, on_error=show_error, on_progress=show_export_progress)
+
+def export_results(path, x_vals, y_vals, coefficients, center, scale, report):
+    export_fit(path, x_vals, y_vals, coefficients, progress=report, center=center, scale=scale)
+    return path
+
+def export_done(path):
+    progress_bar["value"] = 100
+    messagebox.showinfo("Exported", f"Data, fitted values and residuals exported to:\n{path}")
+
+def export_data():
+    if last_fit is None:
+        messagebox.showerror("Error", "Nothing has been analyzed yet.")
+        return
+    file_path = filedialog.asksaveasfilename(defaultextension=".csv",
+                                             filetypes=[("CSV files", "*.csv"),
+                                                        ("Columnar binary", "*.npz"),
+                                                        ("JSON files", "*.json")])
     if file_path:
-        with open(file_path, "w") as f:
-            f.write(table_label.cget("text"))
-            f.write("\n")
-            f.write(summary_label.cget("text"))
-            f.write("\n")
-            f.write(interpretation_label.cget("text"))
-        messagebox.showinfo("Saved", f"Data saved to:\n{file_path}")
+        if os.path.splitext(file_path)[1].lower() not in EXPORT_FORMATS:
+            file_path += ".csv"
+        progress_bar["value"] = 0
+        # Rows are written block by block on the export worker
+        export_runner.submit(export_results, file_path, *last_fit,
+                             on_done=export_done, on_error=show_error, on_progress=show_progress)
 
 def exit_app():
-    plt.close('all')  # Close all matplotlib figures
+    if live_session is not None:
+        # Closes the listening socket (and removes a UNIX socket file)
+        live_session.feed.stop()
     root.destroy()
 
 # Create root window
@@ -119,10 +629,6 @@ root.geometry("2500x1750")
 # Set protocol for window close early
 root.protocol("WM_DELETE_WINDOW", exit_app)
 
-# Matplotlib figure and axis
-fig, ax = plt.subplots(figsize=(7, 5))
-canvas = None
-
 # Layout
 top_frame = tk.Frame(root, bg="#e6f0ff", padx=10, pady=5)
 top_frame.pack(fill=tk.X)
@@ -131,7 +637,7 @@ tk.Label(top_frame, text="📈 Linear Regression Calculator", bg="#e6f0ff", font
 control_frame = tk.Frame(root, pady=10)
 control_frame.pack(fill=tk.X)
 
-tk.Label(control_frame, text="Enter (x, y) pairs as Python list of tuples:", font=("Arial", 20)).pack(anchor="w", padx=10)
+tk.Label(control_frame, text="Enter (x, y) pairs as Python list of tuples or two columns:", font=("Arial", 20)).pack(anchor="w", padx=10)
 
 input_box = tk.Text(control_frame, height=4, font=("Courier", 18), wrap=tk.NONE)
 input_box.insert(tk.END, "[(2, 7), (4, 11), (5, 13), (6, 20)]")
@@ -140,11 +646,52 @@ input_box.pack(fill=tk.X, padx=10)
 btn_frame = tk.Frame(control_frame)
 btn_frame.pack(pady=10)
 
-tk.Button(btn_frame, text="🔍 Analyze", command=load_data_and_plot, font=("Arial", 20), bg="#007acc", fg="white").pack(side=tk.LEFT, padx=10)
-tk.Button(btn_frame, text="💾 Save Plot", command=save_plot, font=("Arial", 20), bg="#28a745", fg="white").pack(side=tk.LEFT, padx=10)
-tk.Button(btn_frame, text="📝 Save Data", command=save_data, font=("Arial", 20), bg="#ffc107", fg="black").pack(side=tk.LEFT, padx=10)
+# Disabled until finish_startup has loaded the analysis modules
+live_button = tk.Button(btn_frame, text="📡 Live", command=toggle_live, font=("Arial", 20), bg="#20c997", fg="white")
+analysis_buttons = [
+    tk.Button(btn_frame, text="🔍 Analyze", command=load_data_and_plot, font=("Arial", 20), bg="#007acc", fg="white"),
+    tk.Button(btn_frame, text="👥 Groups", command=open_groups, font=("Arial", 20), bg="#6f42c1", fg="white"),
+    tk.Button(btn_frame, text="📉 Rolling", command=open_rolling, font=("Arial", 20), bg="#fd7e14", fg="white"),
+    tk.Button(btn_frame, text="🩻 Diagnostics", command=open_diagnostics, font=("Arial", 20), bg="#6c757d", fg="white"),
+    live_button,
+    tk.Button(btn_frame, text="💾 Save Plot", command=save_plot, font=("Arial", 20), bg="#28a745", fg="white"),
+    tk.Button(btn_frame, text="🗂 Save All", command=save_all, font=("Arial", 20), bg="#218838", fg="white"),
+    tk.Button(btn_frame, text="📝 Save Data", command=save_data, font=("Arial", 20), bg="#ffc107", fg="black"),
+    tk.Button(btn_frame, text="📤 Export", command=export_data, font=("Arial", 20), bg="#17a2b8", fg="white"),
+]
+for button in analysis_buttons:
+    button.config(state=tk.DISABLED)
+    button.pack(side=tk.LEFT, padx=10)
+degree_var = tk.StringVar(value="1")
+tk.Label(btn_frame, text="Degree:", font=("Arial", 20)).pack(side=tk.LEFT, padx=(10, 0))
+tk.Spinbox(btn_frame, from_=1, to=9, width=2, textvariable=degree_var, state="readonly",
+           font=("Arial", 20)).pack(side=tk.LEFT, padx=10)
+render_mode = tk.StringVar(value="auto")
+tk.Label(btn_frame, text="Points:", font=("Arial", 20)).pack(side=tk.LEFT, padx=(10, 0))
+render_menu = tk.OptionMenu(btn_frame, render_mode, render_mode.get())
+render_menu.config(font=("Arial", 20), state=tk.DISABLED)
+render_menu.pack(side=tk.LEFT, padx=10)
+fit_mode = tk.StringVar(value=LEAST_SQUARES)
+tk.Label(btn_frame, text="Fit:", font=("Arial", 20)).pack(side=tk.LEFT, padx=(10, 0))
+fit_menu = tk.OptionMenu(btn_frame, fit_mode, fit_mode.get())
+fit_menu.config(font=("Arial", 20), state=tk.DISABLED)
+fit_menu.pack(side=tk.LEFT, padx=10)
+intervals_var = tk.BooleanVar(value=False)
+tk.Checkbutton(btn_frame, text="± CI", variable=intervals_var, font=("Arial", 20)).pack(side=tk.LEFT, padx=10)
 tk.Button(btn_frame, text="❌ Exit", command=exit_app, font=("Arial", 20), bg="#cc0000", fg="white").pack(side=tk.LEFT, padx=10)
 
+progress_bar = ttk.Progressbar(btn_frame, length=300, mode="determinate", maximum=100)
+progress_bar.pack(side=tk.LEFT, padx=10)
+
+# Status bar with per-stage timings of the last analysis
+status_frame = tk.Frame(root, bg="#e6f0ff")
+status_frame.pack(side=tk.BOTTOM, fill=tk.X)
+show_timings_var = tk.BooleanVar(value=bool(os.environ.get("REGRESSION_TIMINGS")))
+tk.Checkbutton(status_frame, text="⏱ Timings", variable=show_timings_var, bg="#e6f0ff",
+               font=("Arial", 14), command=lambda: status_label.config(text="")).pack(side=tk.LEFT, padx=10)
+status_label = tk.Label(status_frame, text="", bg="#e6f0ff", anchor="w", font=("Courier", 14))
+status_label.pack(side=tk.LEFT, fill=tk.X, expand=True)
+
 # Main Panels
 main_frame = tk.Frame(root)
 main_frame.pack(fill=tk.BOTH, expand=True)
@@ -152,16 +699,16 @@ main_frame.pack(fill=tk.BOTH, expand=True)
 left_panel = tk.Frame(main_frame)
 left_panel.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
 
-canvas = FigureCanvasTkAgg(fig, master=left_panel)
-canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+plot_placeholder = tk.Label(left_panel, text="Loading…", font=("Arial", 20), fg="#888888")
+plot_placeholder.pack(fill=tk.BOTH, expand=True)
 
 right_panel = tk.Frame(main_frame, bg="#f0f6ff", width=820, padx=30)
 right_panel.pack(side=tk.RIGHT, fill=tk.Y)
 right_panel.pack_propagate(0)
 
 tk.Label(right_panel, text="📊 Data Table & Summary", font=("Helvetica", 28, "bold"), bg="#f0f6ff", fg="#003366").pack(pady=(5, 2))
-table_label = tk.Label(right_panel, text="", bg="#f0f6ff", justify="left", font=("Courier", 20))
-table_label.pack(pady=(0, 10), padx=5, anchor="w")
+table_placeholder = tk.Frame(right_panel, bg="#f0f6ff")
+table_placeholder.pack(pady=(0, 10), padx=5, fill=tk.X)
 
 summary_label = tk.Label(right_panel, text="", bg="#f0f6ff", justify="left", font=("Courier", 20))
 summary_label.pack(pady=(0, 10), padx=5, anchor="w")
@@ -169,8 +716,11 @@ summary_label.pack(pady=(0, 10), padx=5, anchor="w")
 interpretation_label = tk.Label(right_panel, text="", bg="#f0f6ff", justify="left", font=("Courier", 20), wraplength=750)
 interpretation_label.pack(pady=(5, 10), padx=5, anchor="w")
 
-# Run the initial plot
-load_data_and_plot()
-
-# Start the main loop
-root.mainloop()
\ No newline at end of file
+# Paint the window first, then load numpy and matplotlib behind it
+root.update()
+first_paint_ms = (time.perf_counter() - STARTUP_T0) * 1000
+import_errors = []
+loader = threading.Thread(target=warm_imports, args=(import_errors,), daemon=True)
+loader.start()
+wait_for_modules(loader, import_errors)
+root.mainloop()
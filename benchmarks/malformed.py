@@ -0,0 +1,54 @@
+"""Regression check: malformed input must be rejected in linear time.
+
+Run from the repository root::
+
+    python benchmarks/malformed.py [rows]
+
+Each case is a few thousand valid rows or pairs with one bad entry.  An
+ambiguous validation pattern makes such input backtrack exponentially (a
+dozen rows took over a minute once), so every case has to raise
+:class:`ParseError` within ``TIME_LIMIT`` seconds.  Exits with status 1
+otherwise.
+"""
+
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from regression.parsing import ParseError, parse_pairs  # noqa: E402
+
+TIME_LIMIT = 1.0
+
+
+def cases(rows):
+    good_rows = ["1000 2000"] * rows
+    return {
+        "rows, bad last": "\n".join(good_rows + ["5 abc"]),
+        "rows, bad middle": "\n".join(good_rows + ["5 abc"] + good_rows),
+        "comma rows, trailing comma": "\n".join(["1000, 2000 ,  "] * rows + ["5, abc"]),
+        "pairs, bad last": "[" + ", ".join(["(1000, 2000)"] * rows + ["(5, abc)"]) + "]",
+        "pairs, padded": "[" + ", ".join(["(1000 , 2000)  "] * rows + ["(5 abc)"]) + "]",
+    }
+
+
+def main(rows=5_000):
+    failed = False
+    for name, text in cases(rows).items():
+        start = time.perf_counter()
+        try:
+            parse_pairs(text)
+        except ParseError:
+            rejected = True
+        else:
+            rejected = False
+        elapsed = time.perf_counter() - start
+        ok = rejected and elapsed < TIME_LIMIT
+        failed |= not ok
+        print(f"{name:<28}{elapsed * 1e3:>10.1f} ms  {'ok' if ok else 'FAIL'}")
+    return 1 if failed else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main(int(sys.argv[1]) if len(sys.argv) > 1 else 5_000))
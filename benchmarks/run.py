@@ -0,0 +1,206 @@
+"""Reproducible benchmark of every stage of an analysis, run headlessly.
+
+Run from the repository root::
+
+    python benchmarks/run.py                       # 10 … 1e6 points
+    python benchmarks/run.py --max 1e8 --label v2.3
+    python benchmarks/run.py --compare benchmarks/results/v2.2.json
+
+Synthetic datasets of 10 to 10⁸ points are generated from a fixed seed and
+each stage is timed on its own:
+
+========  ==============================================================
+parse     ``parse_pairs`` on the pasted-text form of the data
+legacy    the list-comprehension sums of the 1.x releases and demos
+reduce    ``parallel_fit`` (what Analyze uses)
+format    summary text plus one screen of table rows
+render    ``RegressionPlot.update`` and a full draw on the Agg backend
+save      streaming the whole table to a file, as Save Data does
+========  ==============================================================
+
+Each stage reports its best wall time, throughput and the peak memory
+allocated while it ran (measured in a separate tracemalloc run so tracing
+does not distort the timings).  Results go to ``benchmarks/results/<label>.json``;
+``--compare`` prints the ratio against an earlier results file.
+"""
+
+import argparse
+import json
+import os
+import platform
+import subprocess
+import sys
+import tempfile
+import time
+import tracemalloc
+
+import numpy as np
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+sys.path.insert(0, ROOT)
+
+import matplotlib  # noqa: E402
+
+matplotlib.use("Agg")
+
+from matplotlib.figure import Figure  # noqa: E402
+from matplotlib.backends.backend_agg import FigureCanvasAgg  # noqa: E402
+
+from gui.table import format_rows, header_line, iter_table_lines  # noqa: E402
+from regression import parse_pairs  # noqa: E402
+from regression.parallel import parallel_fit  # noqa: E402
+from regression.plotting import RegressionPlot  # noqa: E402
+
+RESULTS_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), "results")
+STAGES = ("parse", "legacy", "reduce", "format", "render", "save")
+# Stages that build Python objects per point are skipped above these sizes
+STAGE_LIMITS = {"parse": 10**7, "legacy": 10**6, "save": 10**7}
+
+
+def make_dataset(n, seed=0):
+    rng = np.random.default_rng(seed)
+    x = rng.uniform(0, 100, n).round(3)
+    y = (3.0 * x + 7.0 + rng.normal(0, 10, n)).round(3)
+    return x, y
+
+
+def as_text(x, y):
+    return "[" + ", ".join(f"({a!r}, {b!r})" for a, b in zip(x.tolist(), y.tolist())) + "]"
+
+
+def legacy_reduce(data):
+    # compute_and_plot from the 1.x releases, kept verbatim as a baseline
+    x_vals = [point[0] for point in data]
+    y_vals = [point[1] for point in data]
+    x_squared = [x**2 for x in x_vals]
+    y_squared = [y**2 for y in y_vals]
+    xy_products = [x*y for x, y in zip(x_vals, y_vals)]
+    n = len(data)
+    sum_x = sum(x_vals)
+    sum_y = sum(y_vals)
+    sum_x2 = sum(x_squared)
+    sum_y2 = sum(y_squared)
+    sum_xy = sum(xy_products)
+    b = (n * sum_xy - sum_x * sum_y) / (n * sum_x2 - sum_x**2)
+    return b, (sum_y - b * sum_x) / n, sum_y2
+
+
+def format_output(x, y, result):
+    summary = (f"n = {result.n}\nΣx = {result.sum_x}\nΣy = {result.sum_y}\n"
+               f"Σxy = {result.sum_xy}\nΣx² = {result.sum_x2}\n"
+               f"b = {result.slope:.4f}\na = {result.intercept:.4f}\nr = {result.r:.4f}\n")
+    return summary + header_line() + "".join(format_rows(x[:12], y[:12]))
+
+
+def save_table(x, y, path):
+    with open(path, "w") as f:
+        f.writelines(iter_table_lines(x, y))
+
+
+def stage_functions(n, x, y, tmpdir):
+    """Return {stage: (setup, run)}; setup builds inputs outside the timing."""
+    result = parallel_fit(x, y)
+    figure = Figure(figsize=(7, 5))
+    canvas = FigureCanvasAgg(figure)
+    plot = RegressionPlot(figure.add_subplot(), canvas)
+    path = os.path.join(tmpdir, "table.txt")
+
+    def render():
+        plot.update(x, y, result)
+        canvas.draw()
+
+    return {
+        "parse": (lambda: as_text(x, y), parse_pairs),
+        "legacy": (lambda: list(zip(x.tolist(), y.tolist())), legacy_reduce),
+        "reduce": (lambda: None, lambda _: parallel_fit(x, y)),
+        "format": (lambda: None, lambda _: format_output(x, y, result)),
+        "render": (lambda: None, lambda _: render()),
+        "save": (lambda: None, lambda _: save_table(x, y, path)),
+    }
+
+
+def measure(setup, run, repeat):
+    argument = setup()
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        run(argument)
+        best = min(best, time.perf_counter() - start)
+
+    tracemalloc.start()
+    tracemalloc.reset_peak()
+    run(argument)
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return best, peak
+
+
+def git_label():
+    try:
+        return subprocess.run(["git", "describe", "--always", "--dirty"], cwd=ROOT,
+                              capture_output=True, text=True, check=True).stdout.strip()
+    except (OSError, subprocess.CalledProcessError):
+        return "unversioned"
+
+
+def run_benchmarks(sizes, stages, repeat):
+    rows = []
+    with tempfile.TemporaryDirectory() as tmpdir:
+        for n in sizes:
+            x, y = make_dataset(n)
+            functions = stage_functions(n, x, y, tmpdir)
+            for stage in stages:
+                if n > STAGE_LIMITS.get(stage, float("inf")):
+                    continue
+                seconds, peak = measure(*functions[stage], repeat=repeat if n <= 10**6 else 1)
+                row = {"stage": stage, "points": n, "seconds": seconds,
+                       "points_per_second": n / seconds if seconds else None,
+                       "peak_bytes": peak}
+                rows.append(row)
+                print(f"{stage:<8}{n:>13,}{seconds * 1e3:>12.2f} ms"
+                      f"{n / seconds / 1e6 if seconds else 0:>12.2f} M/s"
+                      f"{peak / 2**20:>11.1f} MiB", flush=True)
+    return rows
+
+
+def compare(rows, baseline_path):
+    with open(baseline_path, encoding="utf-8") as f:
+        baseline = {(r["stage"], r["points"]): r for r in json.load(f)["results"]}
+    print(f"\nCompared with {baseline_path} (time ratio, >1 is slower):")
+    for row in rows:
+        old = baseline.get((row["stage"], row["points"]))
+        if old and old["seconds"]:
+            ratio = row["seconds"] / old["seconds"]
+            flag = "  <-- regression" if ratio > 1.2 else ""
+            print(f"{row['stage']:<8}{row['points']:>13,}{ratio:>9.2f}x{flag}")
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description=__doc__.split("\n\n")[0])
+    parser.add_argument("--max", type=float, default=1e6, help="largest dataset size (default 1e6)")
+    parser.add_argument("--stages", nargs="+", choices=STAGES, default=list(STAGES))
+    parser.add_argument("--repeat", type=int, default=3, help="timed repetitions per stage")
+    parser.add_argument("--label", help="name for the results file (default: git describe)")
+    parser.add_argument("--compare", help="earlier results file to compare against")
+    args = parser.parse_args(argv)
+
+    sizes = [10**k for k in range(1, 9) if 10**k <= args.max]
+    print(f"{'stage':<8}{'points':>13}{'best time':>15}{'throughput':>14}{'peak mem':>15}")
+    rows = run_benchmarks(sizes, args.stages, args.repeat)
+
+    label = args.label or git_label()
+    os.makedirs(RESULTS_DIR, exist_ok=True)
+    out_path = os.path.join(RESULTS_DIR, f"{label}.json")
+    with open(out_path, "w", encoding="utf-8") as f:
+        json.dump({"label": label, "python": platform.python_version(),
+                   "numpy": np.__version__, "machine": platform.machine(),
+                   "cpus": os.cpu_count(), "results": rows}, f, indent=1)
+    print(f"\nResults saved to {out_path}")
+
+    if args.compare:
+        compare(rows, args.compare)
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
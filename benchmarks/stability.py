@@ -0,0 +1,54 @@
+"""Accuracy and cost of the fit methods on data with a large offset.
+
+Run from the repository root::
+
+    python benchmarks/stability.py [points]
+
+x are Unix-timestamp-like values (1.7e9 plus a few minutes of millisecond
+samples), y = 0.5·(x - x₀) + noise.  The reference comes from fitting the
+offset-free data, which no method here is allowed to see.
+"""
+
+import os
+import sys
+import time
+
+import numpy as np
+
+sys.path.insert(0, os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir))
+
+from regression import FIT_METHODS, fit  # noqa: E402
+
+OFFSET = 1.7e9
+
+
+def best_time(func, repeat=5):
+    best = float("inf")
+    for _ in range(repeat):
+        start = time.perf_counter()
+        func()
+        best = min(best, time.perf_counter() - start)
+    return best
+
+
+def main(points=1_000_000):
+    rng = np.random.default_rng(0)
+    t = np.arange(points) * 1e-3
+    x = OFFSET + t
+    y = 0.5 * t + rng.normal(size=points)
+    reference = fit(t, y, "centered")
+
+    naive_time = best_time(lambda: fit(x, y, "naive"))
+    print(f"{points:,} points, x ≈ {OFFSET:.1e}")
+    print(f"{'method':<12}{'time (ms)':>11}{'vs naive':>10}{'slope rel. error':>19}{'r abs. error':>15}")
+    for method in FIT_METHODS:
+        elapsed = best_time(lambda: fit(x, y, method))
+        result = fit(x, y, method)
+        slope_error = abs(result.slope - reference.slope) / abs(reference.slope)
+        r_error = abs(result.r - reference.r)
+        print(f"{method:<12}{elapsed * 1e3:>11.2f}{elapsed / naive_time:>9.2f}x"
+              f"{slope_error:>19.2e}{r_error:>15.2e}")
+
+
+if __name__ == "__main__":
+    main(int(sys.argv[1]) if len(sys.argv) > 1 else 1_000_000)
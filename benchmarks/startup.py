@@ -0,0 +1,46 @@
+"""Cold-start time of the desktop app against its targets.
+
+Run from the repository root (needs a display)::
+
+    python benchmarks/startup.py [runs]
+
+Each run starts RegressionLineEquation.py in a fresh interpreter with
+REGRESSION_STARTUP_REPORT=1, which makes the app print the time until the
+window painted and until it was ready to analyze, then quit.  The medians are
+compared with FIRST_PAINT_TARGET_MS and READY_TARGET_MS; the exit status is 1
+if either is missed.
+"""
+
+import os
+import statistics
+import subprocess
+import sys
+
+ROOT = os.path.join(os.path.dirname(os.path.abspath(__file__)), os.pardir)
+APP = os.path.join(ROOT, "RegressionLineEquation.py")
+
+# Keep in sync with RegressionLineEquation.py
+FIRST_PAINT_TARGET_MS = 300
+READY_TARGET_MS = 1500
+
+
+def measure():
+    env = dict(os.environ, REGRESSION_STARTUP_REPORT="1")
+    env.pop("REGRESSION_PROFILE", None)
+    output = subprocess.run([sys.executable, APP], env=env, cwd=ROOT, check=True,
+                            capture_output=True, text=True, timeout=60).stdout
+    first_paint, ready = output.split()[-2:]
+    return float(first_paint), float(ready)
+
+
+def main(runs=5):
+    samples = [measure() for _ in range(runs)]
+    first_paint = statistics.median(s[0] for s in samples)
+    ready = statistics.median(s[1] for s in samples)
+    print(f"window painted  {first_paint:8.0f} ms   (target {FIRST_PAINT_TARGET_MS} ms)")
+    print(f"ready           {ready:8.0f} ms   (target {READY_TARGET_MS} ms)")
+    return int(first_paint > FIRST_PAINT_TARGET_MS or ready > READY_TARGET_MS)
+
+
+if __name__ == "__main__":
+    sys.exit(main(*(int(arg) for arg in sys.argv[1:])))
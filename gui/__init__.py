@@ -0,0 +1,8 @@
+"""Tk widgets used by the Regression Line Analyzer window."""
+
+from .diagnostics import DiagnosticsWindow
+from .groups import GroupBrowser
+from .rolling import RollingWindow
+from .table import VirtualTable
+
+__all__ = ["DiagnosticsWindow", "GroupBrowser", "RollingWindow", "VirtualTable"]
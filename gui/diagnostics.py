@@ -0,0 +1,69 @@
+"""Window with residual diagnostics: residual and QQ plots and an influence table."""
+
+import tkinter as tk
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from regression.diagnostics import qq_points
+from regression.plotting import DEFAULT_SCATTER_LIMIT, draw_points
+
+
+class DiagnosticsWindow(tk.Toplevel):
+    """Fit statistics, residuals against fitted values, a normal QQ plot and
+    the points with the largest Cook's distance.
+
+    The residual plot is drawn with the main window's render mode, and the
+    QQ plot is LTTB-reduced, so both stay quick for millions of points.
+    """
+
+    def __init__(self, master, x, y, result, mode="auto", scatter_limit=DEFAULT_SCATTER_LIMIT,
+                 title="Diagnostics"):
+        super().__init__(master)
+        self.title(f"{title} ({result.n:,} points)")
+        self.geometry("1600x1100")
+
+        tk.Label(self, text=(f"R² = {result.r_squared:.6f}    s = {result.residual_se:.6g}    "
+                             f"SE(b) = {result.slope_se:.6g}    SE(a) = {result.intercept_se:.6g}"),
+                 font=("Courier", 18), anchor="w").pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        # Kept for "Save All", which exports every open figure
+        self.figure = figure = Figure(figsize=(10, 4.5))
+        residual_ax, qq_ax = figure.subplots(1, 2)
+        draw_points(residual_ax, result.fitted(y), result.residuals, mode, scatter_limit,
+                    size=20, label="Residuals")
+        residual_ax.axhline(0, color="red", linewidth=1)
+        residual_ax.set_xlabel("fitted value", fontsize=14)
+        residual_ax.set_ylabel("residual", fontsize=14)
+        residual_ax.set_title("Residuals vs fitted", fontsize=16)
+        residual_ax.grid(True)
+
+        quantiles, ordered = qq_points(result.standardized)
+        qq_ax.scatter(quantiles, ordered, color="blue", s=10)
+        low, high = quantiles[0], quantiles[-1]
+        qq_ax.plot([low, high], [low, high], color="red", linewidth=1)
+        qq_ax.set_xlabel("normal quantile", fontsize=14)
+        qq_ax.set_ylabel("standardized residual", fontsize=14)
+        qq_ax.set_title("Normal QQ", fontsize=16)
+        qq_ax.grid(True)
+        figure.tight_layout()
+
+        canvas = FigureCanvasTkAgg(figure, master=self)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas.draw()
+
+        # 4/n is the usual rule of thumb for a point worth a second look
+        threshold = 4 / result.n
+        tk.Label(self, text=f"Most influential points (Cook's distance > {threshold:.3g} marked *)",
+                 font=("Arial", 16), anchor="w").pack(fill=tk.X, padx=10)
+        tk.Label(self, text=(f"{'index':>10}{'x':>14}{'y':>14}{'residual':>14}"
+                             f"{'std. res.':>12}{'leverage':>12}{'Cook D':>12}"),
+                 font=("Courier", 16), anchor="w").pack(fill=tk.X, padx=10)
+        listbox = tk.Listbox(self, font=("Courier", 16), height=10, activestyle="none")
+        listbox.pack(fill=tk.X, padx=10, pady=(0, 10))
+        listbox.insert(tk.END, *(
+            f"{i:>10,}{x[i]:>14.6g}{y[i]:>14.6g}{result.residuals[i]:>14.6g}"
+            f"{result.standardized[i]:>12.4f}{result.leverage[i]:>12.4g}{result.cooks[i]:>12.4g}"
+            f"{' *' if result.cooks[i] > threshold else ''}"
+            for i in result.influential()
+        ))
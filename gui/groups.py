@@ -0,0 +1,39 @@
+"""Window listing per-group fits; selecting a group shows it in the main plot."""
+
+import tkinter as tk
+
+
+class GroupBrowser(tk.Toplevel):
+    """List of groups with n, slope, intercept and r.
+
+    ``on_select(index)`` is called with the group's position in ``result``.
+    """
+
+    def __init__(self, master, result, on_select, title="Groups"):
+        super().__init__(master)
+        self.title(f"{title} ({len(result):,} groups)")
+        self.geometry("900x700")
+        self._on_select = on_select
+
+        tk.Label(self, text=f"{'group':<16}{'n':>10}{'slope':>14}{'intercept':>14}{'r':>10}",
+                 font=("Courier", 16), anchor="w").pack(fill=tk.X, padx=10, pady=(10, 0))
+
+        frame = tk.Frame(self)
+        frame.pack(fill=tk.BOTH, expand=True, padx=10, pady=10)
+        self._listbox = tk.Listbox(frame, font=("Courier", 16), activestyle="none",
+                                   exportselection=False)
+        scrollbar = tk.Scrollbar(frame, orient=tk.VERTICAL, command=self._listbox.yview)
+        self._listbox.config(yscrollcommand=scrollbar.set)
+        scrollbar.pack(side=tk.RIGHT, fill=tk.Y)
+        self._listbox.pack(side=tk.LEFT, fill=tk.BOTH, expand=True)
+
+        self._listbox.insert(tk.END, *(
+            f"{str(key)[:15]:<16}{n:>10,}{slope:>14.4g}{intercept:>14.4g}{r:>10.4f}"
+            for key, n, slope, intercept, r in result.rows()
+        ))
+        self._listbox.bind("<<ListboxSelect>>", self._selected)
+
+    def _selected(self, event):
+        selection = self._listbox.curselection()
+        if selection:
+            self._on_select(selection[0])
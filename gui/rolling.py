@@ -0,0 +1,52 @@
+"""Window plotting rolling-window slope and r as time series, with export."""
+
+import tkinter as tk
+from tkinter import filedialog
+
+from matplotlib.backends.backend_tkagg import FigureCanvasTkAgg
+from matplotlib.figure import Figure
+
+from regression.plotting import downsample
+
+
+class RollingWindow(tk.Toplevel):
+    """Slope and r of every window against the x of the window's last point.
+
+    Long series are reduced with LTTB for display; the export writes every
+    window.  ``on_export(result, path)`` writes the file, so the caller
+    can run it off the GUI thread.
+    """
+
+    def __init__(self, master, result, on_export, title="Rolling fit"):
+        super().__init__(master)
+        self.title(f"{title} ({len(result):,} windows of {result.window:,} points)")
+        self.geometry("1400x1000")
+        self._result = result
+        self._on_export = on_export
+
+        tk.Button(self, text="💾 Export", command=self._export, font=("Arial", 18),
+                  bg="#28a745", fg="white").pack(anchor="w", padx=10, pady=10)
+
+        self.figure = figure = Figure(figsize=(9, 6))
+        slope_ax, r_ax = figure.subplots(2, 1, sharex=True)
+        for ax, values, name, color in ((slope_ax, result.slope, "slope", "tab:blue"),
+                                        (r_ax, result.r, "r", "tab:red")):
+            x_shown, y_shown = downsample(result.x_end, values)
+            ax.plot(x_shown, y_shown, color=color)
+            ax.set_ylabel(name, fontsize=16)
+            ax.grid(True)
+        r_ax.set_ylim(-1.05, 1.05)
+        r_ax.set_xlabel("x at window end", fontsize=16)
+        slope_ax.set_title(f"Rolling regression, window = {result.window:,} points", fontsize=18)
+        figure.tight_layout()
+
+        canvas = FigureCanvasTkAgg(figure, master=self)
+        canvas.get_tk_widget().pack(fill=tk.BOTH, expand=True)
+        canvas.draw()
+
+    def _export(self):
+        file_path = filedialog.asksaveasfilename(parent=self, defaultextension=".csv",
+                                                 filetypes=[("CSV files", "*.csv"),
+                                                            ("NumPy arrays", "*.npz")])
+        if file_path:
+            self._on_export(self._result, file_path)
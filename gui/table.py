@@ -0,0 +1,131 @@
+"""Scrollable x, y, x², y², xy table that only renders the visible rows.
+
+The widget keeps references to the x and y arrays and formats the handful of
+rows in view whenever the user scrolls, so opening a million-row dataset costs
+the same as opening four rows.
+"""
+
+import tkinter as tk
+
+import numpy as np
+
+COLUMNS = ("x", "y", "x²", "y²", "xy")
+# Wide enough for any .6g value, e.g. -1.23457e+06
+COLUMN_WIDTH = 12
+EXPORT_BLOCK_ROWS = 10_000
+
+
+def _row_values(x, y):
+    return x, y, x * x, y * y, x * y
+
+
+def format_rows(x, y):
+    """Format the rows of ``x`` and ``y`` as fixed-width lines for display."""
+    columns = _row_values(x, y)
+    return [
+        " ".join(f"{v:<{COLUMN_WIDTH}.6g}" for v in row).rstrip() + "\n"
+        for row in zip(*columns)
+    ]
+
+
+def header_line():
+    return " ".join(f"{name:<{COLUMN_WIDTH}}" for name in COLUMNS).rstrip() + "\n"
+
+
+def export_rows(x, y):
+    """Format the rows as tab-separated lines with every value in full.
+
+    ``repr`` of a float is the shortest text that reads back as the same
+    number, so the saved table loses nothing.
+    """
+    columns = [column.tolist() for column in _row_values(x, y)]
+    return ["\t".join(map(repr, row)) + "\n" for row in zip(*columns)]
+
+
+def iter_table_lines(x, y, block_rows=EXPORT_BLOCK_ROWS):
+    """Yield the table of ``x`` and ``y`` as text, one block of rows at a time."""
+    yield "\t".join(COLUMNS) + "\n"
+    for start in range(0, x.size, block_rows):
+        stop = start + block_rows
+        yield "".join(export_rows(x[start:stop], y[start:stop]))
+
+
+class VirtualTable(tk.Frame):
+    """Virtualised table bound to a pair of numpy arrays."""
+
+    def __init__(self, master, height=12, font=("Courier", 16), bg=None, **kwargs):
+        super().__init__(master, bg=bg, **kwargs)
+        self._height = height
+        self._x = np.empty(0)
+        self._y = np.empty(0)
+        self._first = 0
+
+        self._header = tk.Label(self, text=header_line(), font=font, bg=bg,
+                                anchor="w", justify="left")
+        self._header.grid(row=0, column=0, sticky="w")
+        self._body = tk.Text(self, height=height, font=font, bg=bg, wrap=tk.NONE,
+                             relief=tk.FLAT, borderwidth=0, highlightthickness=0,
+                             cursor="arrow", state=tk.DISABLED)
+        self._body.grid(row=1, column=0, sticky="nsew")
+        self._scrollbar = tk.Scrollbar(self, orient=tk.VERTICAL, command=self._on_scrollbar)
+        self._scrollbar.grid(row=1, column=1, sticky="ns")
+        self.columnconfigure(0, weight=1)
+
+        for widget in (self._body, self._header):
+            widget.bind("<MouseWheel>", self._on_wheel)
+            widget.bind("<Button-4>", lambda e: self.scroll_to(self._first - 3))
+            widget.bind("<Button-5>", lambda e: self.scroll_to(self._first + 3))
+        self._render()
+
+    def __len__(self):
+        return self._x.size
+
+    def set_data(self, x, y):
+        """Show new arrays; they are referenced, not copied."""
+        self._x = x
+        self._y = y
+        self._first = 0
+        self._render()
+
+    def scroll_to(self, row):
+        last_first = max(0, len(self) - self._height)
+        row = min(max(0, int(row)), last_first)
+        if row != self._first:
+            self._first = row
+            self._render()
+
+    def iter_lines(self, block_rows=EXPORT_BLOCK_ROWS):
+        """Iterate over the full table as text, one block of rows at a time.
+
+        The current arrays are bound when this is called, so the iterator can
+        be consumed on another thread while the table moves on to new data.
+        """
+        return iter_table_lines(self._x, self._y, block_rows)
+
+    def _on_scrollbar(self, action, value, unit=None):
+        if action == tk.MOVETO:
+            self.scroll_to(round(float(value) * len(self)))
+        elif action == tk.SCROLL:
+            step = self._height if unit == tk.PAGES else 1
+            self.scroll_to(self._first + int(value) * step)
+
+    def _on_wheel(self, event):
+        # Windows reports multiples of 120, macOS small deltas
+        notches = event.delta // 120 if abs(event.delta) >= 120 else event.delta
+        self.scroll_to(self._first - 3 * notches)
+        return "break"
+
+    def _render(self):
+        n = len(self)
+        stop = min(n, self._first + self._height)
+        lines = format_rows(self._x[self._first:stop], self._y[self._first:stop])
+
+        self._body.config(state=tk.NORMAL)
+        self._body.delete("1.0", tk.END)
+        self._body.insert(tk.END, "".join(lines).rstrip("\n"))
+        self._body.config(state=tk.DISABLED)
+
+        if n:
+            self._scrollbar.set(self._first / n, stop / n)
+        else:
+            self._scrollbar.set(0.0, 1.0)
@@ -0,0 +1,56 @@
+"""GUI-free regression core for the Regression Line Analyzer."""
+
+from .binary import fit_file, open_pairs
+from .diagnostics import DiagnosticsResult, diagnose
+from .engine import (
+    FIT_METHODS,
+    RegressionResult,
+    as_float_arrays,
+    compute_sums,
+    fit,
+    result_from_moments,
+    result_from_sums,
+)
+from .export import export_fit
+from .grouped import GroupedResult, fit_groups
+from .multiple import CrossProducts, fit_multiple, fit_polynomial
+from .parallel import parallel_fit
+from .parsing import ParseError, load_pairs, parse_pairs
+from .resampling import IntervalResult, confidence_intervals
+from .robust import ROBUST_METHODS, RobustResult, robust_fit
+from .rolling import RollingResult, rolling_fit
+from .streaming import OnlineRegression
+from .summary import SufficientStats
+
+__all__ = [
+    "FIT_METHODS",
+    "CrossProducts",
+    "DiagnosticsResult",
+    "GroupedResult",
+    "IntervalResult",
+    "OnlineRegression",
+    "ParseError",
+    "ROBUST_METHODS",
+    "RegressionResult",
+    "RobustResult",
+    "RollingResult",
+    "SufficientStats",
+    "as_float_arrays",
+    "compute_sums",
+    "confidence_intervals",
+    "diagnose",
+    "export_fit",
+    "fit",
+    "fit_file",
+    "fit_groups",
+    "fit_multiple",
+    "fit_polynomial",
+    "load_pairs",
+    "open_pairs",
+    "parallel_fit",
+    "parse_pairs",
+    "result_from_moments",
+    "result_from_sums",
+    "robust_fit",
+    "rolling_fit",
+]
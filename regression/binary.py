@@ -0,0 +1,87 @@
+"""Memory-mapped binary input for datasets larger than RAM.
+
+Raw files hold interleaved little-endian ``x, y`` values (float64 or float32);
+``.npy`` files hold an ``(n, 2)`` array or a flat interleaved one.  The file is
+mapped, never read whole, and the regression sums are reduced one fixed-size
+block at a time so resident memory stays bounded by the block size.
+"""
+
+import os
+
+import numpy as np
+
+from .engine import FIT_METHODS, compensated_block_moments, result_from_moments, result_from_sums
+
+DEFAULT_BLOCK_POINTS = 1 << 20  # (x, y) pairs per block
+RAW_DTYPES = {
+    ".f64": np.dtype("<f8"),
+    ".bin": np.dtype("<f8"),
+    ".f32": np.dtype("<f4"),
+}
+BINARY_EXTENSIONS = (".npy",) + tuple(RAW_DTYPES)
+
+
+def open_pairs(path, dtype=None):
+    """Memory-map ``path`` as an ``(n, 2)`` array of interleaved (x, y) values.
+
+    ``dtype`` overrides the raw-file type implied by the extension; it is
+    ignored for ``.npy`` files, which describe themselves.
+    """
+    ext = os.path.splitext(path)[1].lower()
+    if ext == ".npy":
+        values = np.load(path, mmap_mode="r")
+    else:
+        dtype = np.dtype(dtype) if dtype is not None else RAW_DTYPES.get(ext, np.dtype("<f8"))
+        if os.path.getsize(path) == 0:
+            return np.empty((0, 2), dtype=dtype)
+        values = np.memmap(path, dtype=dtype, mode="r")
+
+    if values.ndim == 1:
+        if values.size % 2:
+            raise ValueError(f"{path}: odd number of values, expected interleaved (x, y) pairs")
+        values = values.reshape(-1, 2)
+    if values.ndim != 2 or values.shape[1] != 2:
+        raise ValueError(f"{path}: expected an (n, 2) array, got shape {values.shape}")
+    return values
+
+
+def iter_blocks(pairs, block_points=DEFAULT_BLOCK_POINTS):
+    """Yield contiguous float64 ``(x, y)`` copies of successive blocks."""
+    for start in range(0, len(pairs), block_points):
+        block = np.asarray(pairs[start:start + block_points], dtype=np.float64)
+        yield np.ascontiguousarray(block[:, 0]), np.ascontiguousarray(block[:, 1])
+
+
+def blockwise_sums(pairs, block_points=DEFAULT_BLOCK_POINTS):
+    """Reduce (n, Σx, Σy, Σx², Σy², Σxy) over ``pairs`` block by block."""
+    sum_x = sum_y = sum_x2 = sum_y2 = sum_xy = 0.0
+    for x, y in iter_blocks(pairs, block_points):
+        sum_x += float(x.sum())
+        sum_y += float(y.sum())
+        sum_x2 += float(np.dot(x, x))
+        sum_y2 += float(np.dot(y, y))
+        sum_xy += float(np.dot(x, y))
+    return len(pairs), sum_x, sum_y, sum_x2, sum_y2, sum_xy
+
+
+def fit_file(path, dtype=None, block_points=DEFAULT_BLOCK_POINTS, workers=1, method="centered"):
+    """Fit y = a + bx to a binary file without loading it into memory.
+
+    ``method`` has the same meaning as for :func:`regression.fit`; every
+    method reduces the file one block at a time.  With ``workers`` > 1 the
+    blocks are reduced on that many threads, all reading the same memory
+    map, which is only supported for ``"centered"`` (the per-thread moments
+    are merged pairwise).
+    """
+    if method not in FIT_METHODS:
+        raise ValueError(f"Unknown fit method {method!r}; expected one of {FIT_METHODS}")
+    if workers > 1 and method != "centered":
+        raise ValueError(f"Method {method!r} reduces a file on one thread; "
+                         f"use method 'centered' for {workers} workers")
+    pairs = open_pairs(path, dtype)
+    if method == "naive":
+        return result_from_sums(*blockwise_sums(pairs, block_points))
+    if method == "compensated" and len(pairs):
+        return result_from_moments(*compensated_block_moments(iter_blocks(pairs, block_points)))
+    from .parallel import parallel_fit_pairs
+    return parallel_fit_pairs(pairs, workers, block_points)
@@ -0,0 +1,176 @@
+"""Content-addressed cache for parsed data, fits and formatted output.
+
+Entries are keyed by a BLAKE2 hash of the input bytes plus any parameters
+that affect the result, so identical data hits the cache no matter where it
+came from.  The in-memory layer is an LRU bounded by an estimate of the bytes
+it holds; the optional on-disk layer stores pickles in a directory and evicts
+the least recently used files once it exceeds its own byte budget.
+"""
+
+import hashlib
+import os
+import pickle
+import tempfile
+import threading
+from collections import OrderedDict
+
+import numpy as np
+
+DEFAULT_MEMORY_BYTES = 512 * 1024 * 1024
+DEFAULT_DISK_BYTES = 4 * 1024 * 1024 * 1024
+
+
+def content_key(data, *params):
+    """Hash ``data`` (str or bytes) together with ``params`` into a hex key."""
+    digest = hashlib.blake2b(digest_size=20)
+    digest.update(data.encode("utf-8") if isinstance(data, str) else data)
+    for param in params:
+        digest.update(b"\0" + repr(param).encode("utf-8"))
+    return digest.hexdigest()
+
+
+def estimate_size(value):
+    """Rough byte size of ``value``, counting numpy buffers and strings."""
+    if isinstance(value, np.ndarray):
+        return value.nbytes
+    if isinstance(value, (str, bytes)):
+        return len(value)
+    if isinstance(value, (tuple, list)):
+        return 64 + sum(estimate_size(item) for item in value)
+    if isinstance(value, dict):
+        return 64 + sum(estimate_size(k) + estimate_size(v) for k, v in value.items())
+    return 64
+
+
+class LRUCache:
+    """Thread-safe LRU mapping bounded by the estimated size of its values."""
+
+    def __init__(self, max_bytes=DEFAULT_MEMORY_BYTES):
+        self.max_bytes = max_bytes
+        self.size = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key, default=None):
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return default
+            self._entries.move_to_end(key)
+            return entry[0]
+
+    def put(self, key, value):
+        size = estimate_size(value)
+        with self._lock:
+            old = self._entries.pop(key, None)
+            if old is not None:
+                self.size -= old[1]
+            if size > self.max_bytes:
+                return
+            self._entries[key] = (value, size)
+            self.size += size
+            while self.size > self.max_bytes:
+                _, (_, evicted) = self._entries.popitem(last=False)
+                self.size -= evicted
+
+    def clear(self):
+        with self._lock:
+            self._entries.clear()
+            self.size = 0
+
+    def __len__(self):
+        return len(self._entries)
+
+
+class DiskCache:
+    """Directory of pickled entries evicted by access time once over budget.
+
+    Writes go through a temporary file and ``os.replace`` so several
+    processes can share one directory.  The directory is only rescanned for
+    eviction after roughly a sixteenth of the budget has been written, so the
+    budget can be overshot by that much.  Only point it at a directory you
+    trust: entries are unpickled.
+    """
+
+    def __init__(self, directory, max_bytes=DEFAULT_DISK_BYTES):
+        self.directory = directory
+        self.max_bytes = max_bytes
+        self._written = 0
+        os.makedirs(directory, exist_ok=True)
+
+    def _path(self, key):
+        return os.path.join(self.directory, key + ".pkl")
+
+    def get(self, key, default=None):
+        path = self._path(key)
+        try:
+            with open(path, "rb") as f:
+                value = pickle.load(f)
+        except (OSError, EOFError, pickle.UnpicklingError):
+            return default
+        try:
+            os.utime(path)  # mark as recently used
+        except OSError:
+            pass
+        return value
+
+    def put(self, key, value):
+        fd, tmp = tempfile.mkstemp(dir=self.directory, suffix=".tmp")
+        try:
+            with os.fdopen(fd, "wb") as f:
+                pickle.dump(value, f, protocol=pickle.HIGHEST_PROTOCOL)
+                self._written += f.tell()
+            os.replace(tmp, self._path(key))
+        except BaseException:
+            try:
+                os.remove(tmp)
+            except OSError:
+                pass
+            raise
+        if self._written > self.max_bytes // 16:
+            self.evict()
+
+    def evict(self):
+        self._written = 0
+        entries = []
+        total = 0
+        with os.scandir(self.directory) as it:
+            for entry in it:
+                if entry.name.endswith(".pkl"):
+                    stat = entry.stat()
+                    entries.append((stat.st_mtime, stat.st_size, entry.path))
+                    total += stat.st_size
+        entries.sort()
+        for _, size, path in entries:
+            if total <= self.max_bytes:
+                break
+            try:
+                os.remove(path)
+            except OSError:
+                continue
+            total -= size
+
+
+class ResultCache:
+    """Memory LRU in front of an optional :class:`DiskCache`."""
+
+    def __init__(self, memory_bytes=DEFAULT_MEMORY_BYTES, directory=None,
+                 disk_bytes=DEFAULT_DISK_BYTES):
+        self.memory = LRUCache(memory_bytes)
+        self.disk = DiskCache(directory, disk_bytes) if directory else None
+
+    def get(self, key, default=None):
+        value = self.memory.get(key)
+        if value is not None:
+            return value
+        if self.disk is not None:
+            value = self.disk.get(key)
+            if value is not None:
+                self.memory.put(key, value)
+                return value
+        return default
+
+    def put(self, key, value):
+        self.memory.put(key, value)
+        if self.disk is not None:
+            self.disk.put(key, value)
@@ -0,0 +1,234 @@
+"""Headless batch mode: regress many data files without any GUI.
+
+Usage::
+
+    python -m regression data/ more_data/run_7.csv -o results.csv --jobs 8
+
+Every file (directories are searched recursively) is parsed and fitted in a
+process pool; binary ``.npy``/``.f64``/``.f32`` captures are memory-mapped and
+reduced in blocks, and one row per dataset is written to CSV or JSON as the results
+come in.  Nothing from tkinter or matplotlib is imported.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+from concurrent.futures import ProcessPoolExecutor
+from functools import partial
+
+import numpy as np
+
+from .binary import BINARY_EXTENSIONS, fit_file, iter_blocks, open_pairs
+from .cache import DiskCache, content_key
+from .engine import FIT_METHODS, fit
+from .parallel import chunk_moments, pairwise_merge
+from .parsing import ParseError, load_pairs
+from .robust import ROBUST_METHODS, robust_fit
+from .summary import SufficientStats
+
+TEXT_EXTENSIONS = (".txt", ".csv", ".tsv", ".dat")
+DATA_EXTENSIONS = TEXT_EXTENSIONS + BINARY_EXTENSIONS
+FIELDS = ("path", "n", "slope", "intercept", "r", "error")
+
+
+def find_data_files(paths, extensions=DATA_EXTENSIONS):
+    """Expand files and directories into a sorted list of data files."""
+    files = []
+    for path in paths:
+        if os.path.isdir(path):
+            for dirpath, _dirnames, filenames in os.walk(path):
+                files.extend(os.path.join(dirpath, name) for name in filenames
+                             if name.lower().endswith(extensions))
+        else:
+            files.append(path)
+    return sorted(files)
+
+
+_disk_caches = {}
+
+
+def _disk_cache(directory):
+    # One instance per worker process so eviction bookkeeping is shared
+    cache = _disk_caches.get(directory)
+    if cache is None:
+        cache = _disk_caches[directory] = DiskCache(directory)
+    return cache
+
+
+def _file_key(path, method, robust=None, summary=False):
+    params = (method, robust) if robust else (method,)
+    if summary:
+        params += ("summary",)
+    if path.lower().endswith(BINARY_EXTENSIONS):
+        # Hashing a capture larger than RAM would cost as much as fitting it
+        stat = os.stat(path)
+        return content_key(os.path.abspath(path), stat.st_size, stat.st_mtime_ns, "binary", *params)
+    with open(path, "rb") as f:
+        return content_key(f.read(), "text", *params)
+
+
+def _load_arrays(path):
+    if path.lower().endswith(BINARY_EXTENSIONS):
+        pairs = open_pairs(path)
+        return np.array(pairs[:, 0], dtype=np.float64), np.array(pairs[:, 1], dtype=np.float64)
+    return load_pairs(path)
+
+
+def _pairs_stats(pairs):
+    # Centred moments block by block, so a memory-mapped capture is never loaded whole
+    return SufficientStats.from_accumulator(
+        pairwise_merge(chunk_moments(x, y) for x, y in iter_blocks(pairs)))
+
+
+def analyze_file(path, cache_dir=None, threads=1, method="centered", robust=None, summary=False):
+    """Fit one file and return its result row; failures are reported, not raised.
+
+    With ``robust`` the slope and intercept come from that robust estimator;
+    r and the merged summary still describe the least-squares statistics.
+    With ``summary`` the row also carries the file's :class:`SufficientStats`
+    under ``"stats"`` (for ``--merged-summary``).
+    """
+    row = dict.fromkeys(FIELDS, "")
+    row["path"] = path
+    try:
+        cache = key = None
+        if cache_dir:
+            cache = _disk_cache(cache_dir)
+            key = _file_key(path, method, robust, summary)
+            cached = cache.get(key)
+            if cached is not None:
+                row.update(cached)
+                return row
+
+        stats = None
+        if robust:
+            # Robust estimators need the whole dataset in memory
+            x, y = _load_arrays(path)
+            result = fit(x, y, method=method)
+            if result.n:
+                line = robust_fit(x, y, robust)
+                result = result._replace(slope=line.slope, intercept=line.intercept)
+        elif path.lower().endswith(BINARY_EXTENSIONS):
+            result = fit_file(path, workers=threads, method=method)
+            if summary:
+                stats = _pairs_stats(open_pairs(path))
+        else:
+            x, y = load_pairs(path)
+            result = fit(x, y, method=method)
+        if result.n == 0:
+            raise ValueError("no data points")
+        if summary and stats is None:
+            stats = SufficientStats.from_arrays(x, y)
+    except (OSError, UnicodeDecodeError, ParseError, ValueError) as e:
+        row["error"] = str(e)
+        return row
+    values = dict(n=result.n, slope=result.slope, intercept=result.intercept, r=result.r)
+    if summary:
+        # Not an output column; it feeds --merged-summary
+        values["stats"] = stats
+    if cache is not None:
+        cache.put(key, values)
+    row.update(values)
+    return row
+
+
+def _map_results(files, jobs, cache_dir=None, threads=1, method="centered", robust=None,
+                 summary=False):
+    analyze = partial(analyze_file, cache_dir=cache_dir, threads=threads, method=method,
+                      robust=robust, summary=summary)
+    if jobs == 1 or len(files) < 2:
+        return map(analyze, files)
+    executor = ProcessPoolExecutor(max_workers=jobs)
+    # Large chunks keep inter-process overhead negligible for tiny files
+    chunksize = max(1, min(256, len(files) // (jobs * 8)))
+    return _drain(executor, executor.map(analyze, files, chunksize=chunksize))
+
+
+def _drain(executor, results):
+    with executor:
+        yield from results
+
+
+def _merging(rows, stats):
+    for row in rows:
+        if "stats" in row:
+            stats.merge(row["stats"])
+        yield row
+
+
+def write_csv(rows, out):
+    writer = csv.DictWriter(out, fieldnames=FIELDS, lineterminator="\n", extrasaction="ignore")
+    writer.writeheader()
+    count = 0
+    for row in rows:
+        writer.writerow(row)
+        count += 1
+    return count
+
+
+def write_json(rows, out):
+    out.write("[")
+    count = 0
+    for row in rows:
+        out.write(",\n  " if count else "\n  ")
+        json.dump({k: row[k] for k in FIELDS if row[k] != ""}, out)
+        count += 1
+    out.write("\n]\n" if count else "]\n")
+    return count
+
+
+def build_parser():
+    parser = argparse.ArgumentParser(
+        prog="python -m regression",
+        description="Fit y = a + bx to every data file and write one row per dataset.")
+    parser.add_argument("paths", nargs="+", help="data files or directories to search")
+    parser.add_argument("-o", "--output", help="output file (default: standard output)")
+    parser.add_argument("-f", "--format", choices=("csv", "json"),
+                        help="output format (default: from the output extension, else csv)")
+    parser.add_argument("-j", "--jobs", type=int, default=os.cpu_count() or 1,
+                        help="worker processes (default: all cores)")
+    parser.add_argument("-t", "--threads", type=int, default=1,
+                        help="threads reducing each binary capture (useful for a few huge files; "
+                             "centered method only)")
+    parser.add_argument("-m", "--method", choices=FIT_METHODS, default="centered",
+                        help="how the sums are reduced (default: centered, stable for large offsets)")
+    parser.add_argument("-r", "--robust", choices=ROBUST_METHODS,
+                        help="take slope and intercept from an outlier-resistant fit instead of least squares")
+    parser.add_argument("--merged-summary",
+                        help="also save the merged sufficient statistics of all datasets (.json or .npz)")
+    parser.add_argument("--cache-dir", help="reuse results of unchanged files stored in this directory")
+    return parser
+
+
+def main(argv=None):
+    parser = build_parser()
+    args = parser.parse_args(argv)
+    if args.threads > 1 and args.method != "centered":
+        parser.error(f"--threads needs --method centered; {args.method} reduces on one thread")
+    fmt = args.format
+    if fmt is None:
+        fmt = "json" if args.output and args.output.lower().endswith(".json") else "csv"
+    write = write_json if fmt == "json" else write_csv
+
+    files = find_data_files(args.paths)
+    if not files:
+        print("No data files found.", file=sys.stderr)
+        return 1
+
+    rows = _map_results(files, max(1, args.jobs), args.cache_dir, max(1, args.threads), args.method,
+                        args.robust, summary=bool(args.merged_summary))
+    merged = None
+    if args.merged_summary:
+        merged = SufficientStats()
+        rows = _merging(rows, merged)
+    if args.output:
+        with open(args.output, "w", newline="", encoding="utf-8") as out:
+            count = write(rows, out)
+    else:
+        count = write(rows, sys.stdout)
+    if merged is not None:
+        merged.save(args.merged_summary)
+    print(f"Wrote {count} results.", file=sys.stderr)
+    return 0
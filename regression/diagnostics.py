@@ -0,0 +1,122 @@
+"""Residual diagnostics for the straight-line fit: R², standard errors,
+residuals, leverage and Cook's distance.
+
+For a line the hat matrix has a closed form, h_i = 1/n + (x_i - x̄)²/Sxx, so
+no matrix is ever built.  After the centred moments (see
+:func:`regression.engine.centered_moments`), one fused pass works through the
+data in cache-sized blocks and writes each point's residual, leverage and the
+unscaled Cook's distance and standardized residual together, accumulating the
+residual sum of squares on the way.  Two in-place scalings by s² finish the
+job, so millions of points cost a few array sweeps and no n-sized temporaries.
+"""
+
+from statistics import NormalDist
+from typing import NamedTuple
+
+import numpy as np
+
+from .engine import DEFAULT_BLOCK_POINTS, centered_moments
+from .plotting import downsample
+
+# Points listed in the influence table
+INFLUENCE_ROWS = 20
+# Parameters of the line (a and b), for Cook's distance and the residual degrees of freedom
+_PARAMETERS = 2
+
+
+class DiagnosticsResult(NamedTuple):
+    n: int
+    slope: float
+    intercept: float
+    r_squared: float
+    residual_se: float      # s, the residual standard error
+    slope_se: float
+    intercept_se: float
+    residuals: np.ndarray
+    standardized: np.ndarray    # e / (s·√(1 - h)), internally studentized
+    leverage: np.ndarray
+    cooks: np.ndarray
+
+    def fitted(self, y):
+        """Fitted values for the observations ``y`` the diagnostics were computed from."""
+        return y - self.residuals
+
+    def influential(self, count=INFLUENCE_ROWS):
+        """Indices of the ``count`` points with the largest Cook's distance, largest first."""
+        count = min(count, self.n)
+        top = np.argpartition(self.cooks, self.n - count)[self.n - count:]
+        return top[np.argsort(self.cooks[top])[::-1]]
+
+
+def diagnose(x, y, block_points=DEFAULT_BLOCK_POINTS):
+    """Fit y = a + bx and compute its per-point residual diagnostics."""
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional arrays of equal length")
+    n = x.size
+    if n <= _PARAMETERS:
+        raise ValueError("Diagnostics need at least three points.")
+    n, mean_x, mean_y, sxx, syy, sxy = centered_moments(x, y, block_points)
+    if sxx <= 0:
+        raise ValueError("Diagnostics need x values that are not all equal.")
+    slope = sxy / sxx
+    intercept = mean_y - slope * mean_x
+
+    residuals = np.empty(n)
+    standardized = np.empty(n)
+    leverage = np.empty(n)
+    cooks = np.empty(n)
+    sse = 0.0
+    for start in range(0, n, block_points):
+        block = slice(start, start + block_points)
+        dx = x[block] - mean_x
+        e = residuals[block]
+        np.subtract(y[block], mean_y, out=e)
+        e -= slope * dx
+        sse += float(np.dot(e, e))
+        h = leverage[block]
+        np.multiply(dx, dx, out=h)
+        h *= 1 / sxx
+        h += 1 / n
+        # 1 - h, reusing dx
+        np.subtract(1, h, out=dx)
+        np.divide(e, np.sqrt(dx), out=standardized[block])
+        # e²h / (1 - h)², to be divided by p·s² below
+        c = cooks[block]
+        np.divide(standardized[block], dx, out=c)
+        c *= standardized[block]
+        c *= h
+
+    s2 = sse / (n - _PARAMETERS)
+    if s2 > 0:
+        standardized *= 1 / np.sqrt(s2)
+        cooks *= 1 / (_PARAMETERS * s2)
+    else:
+        # A perfect fit: no point has any influence on it
+        standardized.fill(0.0)
+        cooks.fill(0.0)
+    r_squared = 1 - sse / syy if syy > 0 else 1.0
+    return DiagnosticsResult(n, float(slope), float(intercept), float(r_squared), float(np.sqrt(s2)),
+                             float(np.sqrt(s2 / sxx)), float(np.sqrt(s2 * (1 / n + mean_x * mean_x / sxx))),
+                             residuals, standardized, leverage, cooks)
+
+
+def qq_points(standardized, n_out=None):
+    """Normal quantiles and sorted standardized residuals for a QQ plot.
+
+    The sorted residuals are reduced with the same LTTB downsampling as the
+    main scatter, and normal quantiles are only evaluated for the points kept.
+    """
+    ordered = np.sort(standardized)
+    n = ordered.size
+    # Plotting positions (i + 0.5) / n
+    positions = (np.arange(n) + 0.5) / n
+    if n_out is None:
+        positions, ordered = downsample(positions, ordered)
+    else:
+        positions, ordered = downsample(positions, ordered, n_out)
+    normal = NormalDist()
+    quantiles = np.fromiter((normal.inv_cdf(p) for p in positions), dtype=np.float64,
+                            count=positions.size)
+    return quantiles, ordered
@@ -0,0 +1,191 @@
+"""Vectorized least-squares fit of y = a + bx.
+
+The Tk application and the command line tools both call into this module so
+the math lives in exactly one place and never touches a widget.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+FIT_METHODS = ("naive", "centered", "compensated")
+DEFAULT_BLOCK_POINTS = 1 << 16
+
+
+class RegressionResult(NamedTuple):
+    n: int
+    sum_x: float
+    sum_y: float
+    sum_x2: float
+    sum_y2: float
+    sum_xy: float
+    slope: float
+    intercept: float
+    r: float
+
+
+def as_float_arrays(data):
+    """Turn a sequence of (x, y) pairs into two contiguous float64 arrays."""
+    pairs = np.asarray(data, dtype=np.float64)
+    if pairs.size == 0:
+        return np.empty(0), np.empty(0)
+    if pairs.ndim != 2 or pairs.shape[1] != 2:
+        raise ValueError("Data must be a list of (x, y) pairs")
+    return np.ascontiguousarray(pairs[:, 0]), np.ascontiguousarray(pairs[:, 1])
+
+
+def compute_sums(x, y):
+    """Return (n, Σx, Σy, Σx², Σy², Σxy) without allocating temporaries.
+
+    The squared and cross terms are BLAS dot products, so no x², y² or xy
+    array is ever materialised.
+    """
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional arrays of equal length")
+    return (
+        x.size,
+        float(x.sum()),
+        float(y.sum()),
+        float(np.dot(x, x)),
+        float(np.dot(y, y)),
+        float(np.dot(x, y)),
+    )
+
+
+def result_from_sums(n, sum_x, sum_y, sum_x2, sum_y2, sum_xy):
+    """Apply the textbook formulas for b, a and r to precomputed sums."""
+    # Calculate slope (b) and intercept (a) using formulas
+    b_numerator = n * sum_xy - sum_x * sum_y
+    b_denominator = n * sum_x2 - sum_x**2
+    b = b_numerator / b_denominator if b_denominator != 0 else 0.0
+    a = (sum_y - b * sum_x) / n if n != 0 else 0.0
+
+    # Calculate correlation coefficient (r)
+    r_denominator = b_denominator * (n * sum_y2 - sum_y**2)
+    r = b_numerator / np.sqrt(r_denominator) if r_denominator > 0 else 0.0
+
+    return RegressionResult(int(n), sum_x, sum_y, sum_x2, sum_y2, sum_xy,
+                            float(b), float(a), float(r))
+
+
+def result_from_moments(n, mean_x, mean_y, sxx, syy, sxy):
+    """Fit from means and centred sums Σ(x-x̄)², Σ(y-ȳ)², Σ(x-x̄)(y-ȳ).
+
+    The raw sums in the result are reconstructed for display only; b, a and
+    r come straight from the centred terms and do not suffer cancellation.
+    """
+    b = sxy / sxx if sxx > 0 else 0.0
+    a = mean_y - b * mean_x if n else 0.0
+    r_denominator = sxx * syy
+    r = sxy / np.sqrt(r_denominator) if r_denominator > 0 else 0.0
+
+    sum_x = n * mean_x
+    sum_y = n * mean_y
+    return RegressionResult(int(n), float(sum_x), float(sum_y),
+                            float(sxx + sum_x * mean_x), float(syy + sum_y * mean_y),
+                            float(sxy + sum_x * mean_y), float(b), float(a), float(r))
+
+
+def combine_moments(a, b):
+    """Merge two ``(n, x̄, ȳ, Sxx, Syy, Sxy)`` tuples (Chan et al.'s pairwise update)."""
+    n_a, mean_x_a, mean_y_a, sxx_a, syy_a, sxy_a = a
+    n_b, mean_x_b, mean_y_b, sxx_b, syy_b, sxy_b = b
+    if n_b == 0:
+        return a
+    n = n_a + n_b
+    dx = mean_x_b - mean_x_a
+    dy = mean_y_b - mean_y_a
+    weight = n_a * n_b / n
+    return (n, mean_x_a + dx * n_b / n, mean_y_a + dy * n_b / n,
+            sxx_a + sxx_b + dx * dx * weight, syy_a + syy_b + dy * dy * weight,
+            sxy_a + sxy_b + dx * dy * weight)
+
+
+def centered_moments(x, y, block_points=DEFAULT_BLOCK_POINTS):
+    """Two-pass means and centred sums, working in blocks.
+
+    Only ``block_points``-sized deviation arrays are ever allocated, never a
+    centred copy of the whole dataset.
+    """
+    n = x.size
+    mean_x = float(x.sum()) / n
+    mean_y = float(y.sum()) / n
+    sxx = syy = sxy = 0.0
+    # Σ(x - x̄) is zero in exact arithmetic; carrying it corrects the rounding of x̄
+    sdx = sdy = 0.0
+    for start in range(0, n, block_points):
+        dx = x[start:start + block_points] - mean_x
+        dy = y[start:start + block_points] - mean_y
+        sdx += float(dx.sum())
+        sdy += float(dy.sum())
+        sxx += float(np.dot(dx, dx))
+        syy += float(np.dot(dy, dy))
+        sxy += float(np.dot(dx, dy))
+    return (n, mean_x + sdx / n, mean_y + sdy / n,
+            sxx - sdx * sdx / n, syy - sdy * sdy / n, sxy - sdx * sdy / n)
+
+
+def compensated_moments(x, y, block_points=DEFAULT_BLOCK_POINTS):
+    """Single-pass shifted sums with Neumaier-compensated accumulation.
+
+    Every value is shifted by the first point, which removes the large common
+    offset (timestamps, absolute positions) before squaring, and the block
+    partial sums are added with Neumaier's compensation so the running totals
+    do not drift over very long inputs.
+    """
+    return compensated_block_moments(
+        (x[start:start + block_points], y[start:start + block_points])
+        for start in range(0, x.size, block_points))
+
+
+def compensated_block_moments(blocks):
+    """:func:`compensated_moments` over an iterable of float64 ``(x, y)`` blocks.
+
+    Used for inputs that are never in memory whole, such as memory-mapped
+    files.  The blocks must not all be empty.
+    """
+    n = 0
+    shift_x = shift_y = None
+    totals = np.zeros(5)
+    compensation = np.zeros(5)
+    for x, y in blocks:
+        if shift_x is None:
+            shift_x = float(x[0])
+            shift_y = float(y[0])
+        n += x.size
+        dx = x - shift_x
+        dy = y - shift_y
+        block = np.array([dx.sum(), dy.sum(), np.dot(dx, dx), np.dot(dy, dy), np.dot(dx, dy)])
+        t = totals + block
+        big = np.abs(totals) >= np.abs(block)
+        compensation += np.where(big, (totals - t) + block, (block - t) + totals)
+        totals = t
+    sdx, sdy, sdxx, sdyy, sdxy = (totals + compensation).tolist()
+    return (n, shift_x + sdx / n, shift_y + sdy / n,
+            sdxx - sdx * sdx / n, sdyy - sdy * sdy / n, sdxy - sdx * sdy / n)
+
+
+def fit(x, y, method="naive"):
+    """Fit y = a + bx to the arrays ``x`` and ``y``.
+
+    ``method`` selects how the statistics are reduced:
+
+    * ``"naive"`` – the textbook raw sums (fastest; loses precision when the
+      data sit far from zero, e.g. Unix timestamps as x),
+    * ``"centered"`` – two passes, subtracting the means block by block,
+    * ``"compensated"`` – one pass of shifted, Neumaier-compensated sums.
+    """
+    if method == "naive":
+        return result_from_sums(*compute_sums(x, y))
+    if method not in FIT_METHODS:
+        raise ValueError(f"Unknown fit method {method!r}; expected one of {FIT_METHODS}")
+    x = np.ascontiguousarray(x, dtype=np.float64)
+    y = np.ascontiguousarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional arrays of equal length")
+    if x.size == 0:
+        return result_from_sums(0, 0.0, 0.0, 0.0, 0.0, 0.0)
+    moments = centered_moments if method == "centered" else compensated_moments
+    return result_from_moments(*moments(x, y))
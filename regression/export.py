@@ -0,0 +1,121 @@
+"""Streaming export of the data together with fitted values and residuals.
+
+Rows are produced straight from the numeric arrays one fixed-size block at a
+time, so memory stays bounded by the block size whatever the row count; the
+arrays may be memory-maps from :func:`regression.open_pairs`.  The format is
+chosen by extension:
+
+``.csv``   x, y, fitted, residual with a header line; floats round-trip exactly
+``.npz``   columnar binary: one ``.npy`` entry per column plus the coefficients,
+           center and scale; ``np.load(path)[column]`` reads one column into
+           memory without touching the others (``.npz`` entries cannot be
+           memory-mapped)
+``.json``  ``{"columns": [...], "coefficients": [...], "center": c, "scale": s,
+           "rows": [[x, y, fitted, residual], ...]}``
+
+The coefficients are those of t = (x - center) / scale, as returned by
+:func:`regression.fit_polynomial`; a straight line has center 0 and scale 1.
+"""
+
+import json
+import os
+import zipfile
+
+import numpy as np
+
+from .multiple import predict_polynomial
+
+EXPORT_COLUMNS = ("x", "y", "fitted", "residual")
+EXPORT_FORMATS = {".csv": "csv", ".txt": "csv", ".npz": "columns", ".json": "json"}
+DEFAULT_BLOCK_ROWS = 1 << 16
+
+
+def iter_fit_blocks(x, y, coefficients, block_rows=DEFAULT_BLOCK_ROWS, progress=None,
+                    center=0.0, scale=1.0):
+    """Yield ``(x, y, fitted, residual)`` float64 arrays of at most ``block_rows`` rows.
+
+    ``coefficients`` are β₀, β₁, ... of the fitted polynomial in
+    t = (x - center) / scale; a straight line is ``(intercept, slope)``.
+    """
+    n = len(x)
+    for start in range(0, n, block_rows):
+        stop = min(start + block_rows, n)
+        x_block = np.asarray(x[start:stop], dtype=np.float64)
+        y_block = np.asarray(y[start:stop], dtype=np.float64)
+        fitted = predict_polynomial(coefficients, x_block, center, scale)
+        yield x_block, y_block, fitted, y_block - fitted
+        if progress is not None:
+            progress(stop / n)
+
+
+def _write_csv(f, blocks):
+    f.write(",".join(EXPORT_COLUMNS) + "\n")
+    row_format = ",".join(["%r"] * len(EXPORT_COLUMNS)) + "\n"
+    for block in blocks:
+        rows = np.column_stack(block)
+        # One formatting call per block; repr gives the shortest exact float
+        f.write((row_format * len(rows)) % tuple(rows.ravel().tolist()))
+
+
+def _write_json(f, blocks, coefficients, center, scale):
+    header = json.dumps({"columns": list(EXPORT_COLUMNS),
+                         "coefficients": [float(c) for c in coefficients],
+                         "center": float(center), "scale": float(scale)})
+    f.write(header[:-1] + ', "rows": [')
+    separator = ""
+    for block in blocks:
+        f.write(separator)
+        f.write(json.dumps(np.column_stack(block).tolist())[1:-1])
+        separator = ", "
+    f.write("]}\n")
+
+
+def _write_columns(path, x, y, coefficients, center, scale, block_rows, progress):
+    header = {"descr": "<f8", "fortran_order": False, "shape": (len(x),)}
+    with zipfile.ZipFile(path, "w", zipfile.ZIP_STORED, allowZip64=True) as archive:
+        with archive.open("coefficients.npy", "w") as f:
+            np.lib.format.write_array(f, np.asarray(coefficients, dtype="<f8"))
+        for name, value in (("center", center), ("scale", scale)):
+            with archive.open(name + ".npy", "w") as f:
+                np.lib.format.write_array(f, np.asarray(value, dtype="<f8"))
+        # Columns are written one after another, so each needs its own pass
+        for index, name in enumerate(EXPORT_COLUMNS):
+            column_progress = None
+            if progress is not None:
+                column_progress = lambda done, i=index: progress((i + done) / len(EXPORT_COLUMNS))
+            with archive.open(name + ".npy", "w", force_zip64=True) as f:
+                np.lib.format.write_array_header_1_0(f, header)
+                for block in iter_fit_blocks(x, y, coefficients, block_rows, column_progress,
+                                             center, scale):
+                    f.write(block[index].tobytes())
+
+
+def export_fit(path, x, y, coefficients, fmt=None, block_rows=DEFAULT_BLOCK_ROWS, progress=None,
+               center=0.0, scale=1.0):
+    """Write x, y, fitted values and residuals to ``path`` in constant memory.
+
+    ``coefficients``, ``center`` and ``scale`` describe the fit as in
+    :func:`iter_fit_blocks`.  ``fmt`` is ``"csv"``, ``"columns"`` or
+    ``"json"``; by default it follows the extension of ``path``.
+    ``progress`` is called with the fraction written.
+    """
+    if len(x) != len(y):
+        raise ValueError("x and y must have the same length.")
+    if fmt is None:
+        ext = os.path.splitext(path)[1].lower()
+        if ext not in EXPORT_FORMATS:
+            raise ValueError(f"Unknown export format {ext!r}; use one of "
+                             + ", ".join(sorted(EXPORT_FORMATS)))
+        fmt = EXPORT_FORMATS[ext]
+    elif fmt not in EXPORT_FORMATS.values():
+        raise ValueError(f"Unknown export format {fmt!r}.")
+
+    if fmt == "columns":
+        _write_columns(path, x, y, coefficients, center, scale, block_rows, progress)
+        return
+    blocks = iter_fit_blocks(x, y, coefficients, block_rows, progress, center, scale)
+    with open(path, "w", encoding="utf-8", newline="\n", buffering=1 << 20) as f:
+        if fmt == "csv":
+            _write_csv(f, blocks)
+        else:
+            _write_json(f, blocks, coefficients, center, scale)
@@ -0,0 +1,59 @@
+"""Save figures off the GUI thread from snapshots of their state.
+
+Rendering a high-DPI PNG or an SVG of a busy plot can take seconds, and Tk
+cannot process events meanwhile.  :func:`snapshot_figure` therefore only
+pickles the figure on the GUI thread; the artists hold just what is on
+screen (at most the scatter limit of points, or a density grid), so this is
+quick.  :func:`save_figures` rebuilds independent copies from the snapshots
+and renders them with the headless Agg, SVG or PDF canvases on a worker
+thread, while the live figure carries on changing.
+"""
+
+import os
+import pickle
+
+PLOT_FORMATS = ("png", "svg", "pdf")
+EXPORT_DPI = 200
+
+
+def snapshot_figure(figure):
+    """Capture ``figure`` as bytes that :func:`save_figures` can render.
+
+    Animated artists (used for blitting) are skipped by ``savefig``, so they
+    are captured as ordinary ones.
+    """
+    animated = figure.findobj(lambda artist: artist.get_animated())
+    for artist in animated:
+        artist.set_animated(False)
+    try:
+        return pickle.dumps(figure, protocol=pickle.HIGHEST_PROTOCOL)
+    finally:
+        for artist in animated:
+            artist.set_animated(True)
+
+
+def batch_paths(directory, names, formats=PLOT_FORMATS):
+    """``directory/name.format`` for every name and format, grouped by name."""
+    return [[os.path.join(directory, f"{name}.{fmt}") for fmt in formats] for name in names]
+
+
+def save_figures(snapshots, paths, dpi=EXPORT_DPI, progress=None):
+    """Render each snapshot to its list of paths; the format follows the extension.
+
+    Each figure is unpickled once and saved in all of its formats.
+    ``progress`` is called with the fraction of files written.  Returns the
+    paths written.
+    """
+    from matplotlib.backends.backend_agg import FigureCanvasAgg
+
+    total = sum(len(targets) for targets in paths)
+    written = []
+    for snapshot, targets in zip(snapshots, paths):
+        figure = pickle.loads(snapshot)
+        FigureCanvasAgg(figure)
+        for path in targets:
+            figure.savefig(path, dpi=dpi)
+            written.append(path)
+            if progress is not None:
+                progress(len(written) / total)
+    return written
@@ -0,0 +1,295 @@
+"""Live data: tail a growing file or listen on a local socket.
+
+A :class:`LiveFeed` reads on a background thread and parses each batch of
+complete lines (``x, y`` or ``x y`` per line) once, as it arrives.  A
+:class:`LiveSession` folds whatever arrived since the previous frame into an
+:class:`~regression.streaming.OnlineRegression` and a growing point buffer,
+so a refresh costs time proportional to the new points only; history is
+never parsed or summed again.
+
+Sources are given as ``file:PATH``, ``tcp:PORT`` / ``tcp:HOST:PORT`` or
+``unix:PATH`` (a bare path means ``file:``).
+"""
+
+import os
+import queue
+import socket
+import threading
+import time
+
+import numpy as np
+
+from .parsing import DEFAULT_CHUNK_SIZE, ParseError, parse_pairs
+from .streaming import OnlineRegression
+
+DEFAULT_HOST = "127.0.0.1"
+POLL_SECONDS = 0.05
+READ_BYTES = 1 << 16
+# Most recent points drawn in the scatter; the fit always covers all of them
+DISPLAY_POINTS = 20_000
+
+
+def parse_source(spec):
+    """Split ``spec`` into ``(kind, address)`` with kind file, tcp or unix."""
+    kind, sep, rest = spec.partition(":")
+    if not sep or kind not in ("file", "tcp", "unix"):
+        return "file", spec
+    if kind == "tcp":
+        host, _, port = rest.rpartition(":")
+        try:
+            return "tcp", (host or DEFAULT_HOST, int(port))
+        except ValueError:
+            raise ValueError(f"Invalid TCP port in {spec!r}") from None
+    return kind, rest
+
+
+def _parse_each_line(text, xs, ys):
+    # One parse per line: slow, but tells good lines from bad ones
+    skipped = 0
+    for line in text.splitlines():
+        try:
+            x, y = parse_pairs(line)
+        except ParseError:
+            skipped += 1
+            continue
+        xs.append(x)
+        ys.append(y)
+    return skipped
+
+
+def parse_lines(text):
+    """Parse complete lines into x and y arrays, skipping malformed lines.
+
+    The text is parsed in bulk, about one parser chunk at a time.  When a
+    chunk has a bad line, the lines before it are still parsed in bulk and
+    only that line is dropped, so a bad line costs no more than re-reading
+    its chunk.  Returns ``(x, y, skipped)``.
+    """
+    xs, ys, skipped = [], [], 0
+    pos = 0
+    while pos < len(text):
+        end = text.find("\n", pos + DEFAULT_CHUNK_SIZE) + 1 or len(text)
+        block = text[pos:end]
+        try:
+            x, y = parse_pairs(block)
+        except ParseError as e:
+            bad = 0
+            for _ in range(e.line - 1):
+                bad = block.index("\n", bad) + 1
+            bad_end = block.find("\n", bad) + 1 or len(block)
+            if bad:
+                # The first error is on line e.line, so everything before it is valid
+                x, y = parse_pairs(block[:bad])
+                xs.append(x)
+                ys.append(y)
+            try:
+                x, y = parse_pairs(block[bad:bad_end])
+            except ParseError:
+                skipped += 1
+                pos += bad_end
+                continue
+            # Valid on its own but not together with the lines above, e.g. one
+            # "(x, y)" per line without commas in between
+            xs.append(x)
+            ys.append(y)
+            skipped += _parse_each_line(block[bad_end:], xs, ys)
+        else:
+            xs.append(x)
+            ys.append(y)
+        pos = end
+    if not xs:
+        return np.empty(0), np.empty(0), skipped
+    return np.concatenate(xs), np.concatenate(ys), skipped
+
+
+class LiveFeed:
+    """Background reader that queues parsed chunks from one source."""
+
+    def __init__(self, spec):
+        self.kind, self.address = parse_source(spec)
+        self.spec = spec
+        self.error = None
+        self.skipped = 0
+        self._chunks = queue.Queue()
+        self._stop = threading.Event()
+        self._thread = None
+        self._server = None
+        if self.kind != "file":
+            # Bind now so a busy port or path is reported to the caller
+            self._server = self._listen()
+
+    def _listen(self):
+        if self.kind == "tcp":
+            server = socket.create_server(self.address)
+        else:
+            if not hasattr(socket, "AF_UNIX"):
+                raise ValueError("UNIX sockets are not available on this system; use tcp:PORT")
+            if os.path.exists(self.address):
+                os.unlink(self.address)
+            server = socket.socket(socket.AF_UNIX, socket.SOCK_STREAM)
+            server.bind(self.address)
+            server.listen()
+        server.settimeout(POLL_SECONDS)
+        return server
+
+    def start(self):
+        self._thread = threading.Thread(target=self._run, daemon=True)
+        self._thread.start()
+        return self
+
+    def stop(self):
+        self._stop.set()
+        if self._thread is not None:
+            self._thread.join()
+        if self._server is not None:
+            self._server.close()
+            if self.kind == "unix" and os.path.exists(self.address):
+                os.unlink(self.address)
+
+    def drain(self, check=True):
+        """Everything parsed since the last call, as two arrays.
+
+        A reader error is raised here, unless ``check`` is false.
+        """
+        if check and self.error is not None:
+            raise self.error
+        xs, ys = [], []
+        while True:
+            try:
+                x, y = self._chunks.get_nowait()
+            except queue.Empty:
+                break
+            xs.append(x)
+            ys.append(y)
+        if not xs:
+            return np.empty(0), np.empty(0)
+        if len(xs) == 1:
+            return xs[0], ys[0]
+        return np.concatenate(xs), np.concatenate(ys)
+
+    def _run(self):
+        try:
+            if self.kind == "file":
+                self._tail_file()
+            else:
+                self._serve()
+        except Exception as e:
+            self.error = e
+
+    def _feed(self, pending, data):
+        # Only complete lines are parsed; the remainder waits for more bytes
+        pending += data
+        cut = pending.rfind(b"\n")
+        if cut < 0:
+            return pending
+        x, y, skipped = parse_lines(pending[:cut + 1].decode("utf-8", errors="replace"))
+        self.skipped += skipped
+        if x.size:
+            self._chunks.put((x, y))
+        return pending[cut + 1:]
+
+    def _tail_file(self):
+        # Waits for the file to appear, and starts over if it is truncated
+        pending = b""
+        position = 0
+        while not self._stop.is_set():
+            try:
+                size = os.path.getsize(self.address)
+            except OSError:
+                time.sleep(POLL_SECONDS)
+                continue
+            if size < position:
+                position, pending = 0, b""
+            if size == position:
+                time.sleep(POLL_SECONDS)
+                continue
+            # A large existing file is read a bounded block at a time
+            with open(self.address, "rb") as f:
+                f.seek(position)
+                while position < size and not self._stop.is_set():
+                    data = f.read(min(size - position, READ_BYTES))
+                    if not data:
+                        break
+                    position += len(data)
+                    pending = self._feed(pending, data)
+
+    def _serve(self):
+        # One client at a time; when it disconnects, wait for the next one
+        while not self._stop.is_set():
+            try:
+                connection, _ = self._server.accept()
+            except socket.timeout:
+                continue
+            pending = b""
+            with connection:
+                connection.settimeout(POLL_SECONDS)
+                while not self._stop.is_set():
+                    try:
+                        data = connection.recv(READ_BYTES)
+                    except socket.timeout:
+                        continue
+                    except OSError:
+                        # A reset or aborted client ends its connection, not the server
+                        break
+                    if not data:
+                        break
+                    pending = self._feed(pending, data)
+            if pending.strip():
+                self._feed(pending, b"\n")
+
+
+class PointBuffer:
+    """Append-only x and y arrays with amortised O(1) growth."""
+
+    def __init__(self, capacity=1024):
+        self._x = np.empty(capacity)
+        self._y = np.empty(capacity)
+        self.size = 0
+
+    def append(self, x, y):
+        end = self.size + x.size
+        if end > self._x.size:
+            capacity = max(end, 2 * self._x.size)
+            self._x = np.concatenate([self._x[:self.size], np.empty(capacity - self.size)])
+            self._y = np.concatenate([self._y[:self.size], np.empty(capacity - self.size)])
+        self._x[self.size:end] = x
+        self._y[self.size:end] = y
+        self.size = end
+
+    def arrays(self):
+        """Views of all points so far."""
+        return self._x[:self.size], self._y[:self.size]
+
+    def tail(self, count):
+        """Views of the last ``count`` points."""
+        start = max(0, self.size - count)
+        return self._x[start:self.size], self._y[start:self.size]
+
+
+class LiveSession:
+    """Running fit and point history fed by a :class:`LiveFeed`."""
+
+    def __init__(self, spec):
+        self.feed = LiveFeed(spec)
+        self.fit = OnlineRegression()
+        self.points = PointBuffer()
+
+    def start(self):
+        self.feed.start()
+        return self
+
+    def stop(self):
+        self.feed.stop()
+        # Points still queued when the feed stopped, even if it stopped on an error
+        self.update(check=False)
+
+    def update(self, check=True):
+        """Fold in the points that arrived since the last call; returns their count."""
+        x, y = self.feed.drain(check)
+        if x.size:
+            self.fit.add_many(x, y)
+            self.points.append(x, y)
+        return x.size
+
+    def result(self):
+        return self.fit.result()
@@ -0,0 +1,38 @@
+"""Merge regression summary files into the exact global fit.
+
+Usage::
+
+    python -m regression.merge node1.json node2.npz -o total.json
+"""
+
+import argparse
+import sys
+
+from .summary import merge_summaries
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        prog="python -m regression.merge",
+        description="Merge regression summary files into the exact global fit.")
+    parser.add_argument("summaries", nargs="+", help=".json or .npz summary files")
+    parser.add_argument("-o", "--output", help="write the merged summary here")
+    args = parser.parse_args(argv)
+
+    total = merge_summaries(args.summaries)
+    if args.output:
+        total.save(args.output)
+    result = total.result()
+    print(f"n = {result.n}\nslope = {result.slope!r}\nintercept = {result.intercept!r}\nr = {result.r!r}")
+    if total.cross_products is not None:
+        beta = total.cross_products.solve().coefficients.tolist()
+        if total.basis is not None:
+            center, scale = total.basis
+            print(f"β (in t = (x - {center!r}) / {scale!r}) = {beta}")
+        else:
+            print(f"β = {beta}")
+    return 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
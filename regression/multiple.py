@@ -0,0 +1,244 @@
+"""Multiple linear and polynomial least squares on accumulated cross-products.
+
+The design matrix is never built in full.  Rows are folded in chunk by chunk
+into XᵀX, Xᵀy and yᵀy (with a leading column of ones for the intercept), and
+the normal equations (XᵀX)β = Xᵀy are solved by a Cholesky factorisation of
+the diagonally equilibrated XᵀX, falling back to an SVD-based least-squares
+solve when the matrix is numerically singular.
+
+Raw cross-products of predictors far from zero (timestamps, positions) cancel
+catastrophically, and no rescaling of XᵀX recovers the lost digits.  Every
+predictor and y are therefore shifted by their means over the first chunk
+before they are multiplied, and the intercept is shifted back after the
+solve.  Accumulators with different shifts merge exactly: the sums of one are
+re-expressed about the other's shift, the matrix analogue of Chan's update.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_CHUNK_ROWS = 1 << 16
+
+
+class MultipleRegressionResult(NamedTuple):
+    n: int
+    coefficients: np.ndarray  # β₀ (intercept), β₁, ..., βₖ; polynomial fits: powers of t
+    r_squared: float
+    xtx: np.ndarray  # unshifted XᵀX and Xᵀy, for display
+    xty: np.ndarray
+    center: float = 0.0  # polynomial fits solve in t = (x - center) / scale
+    scale: float = 1.0
+
+
+class CrossProducts:
+    """Running XᵀX, Xᵀy, yᵀy and n for ``k`` predictors plus an intercept.
+
+    The sums are of the predictors minus ``shift`` and of y minus
+    ``y_shift``; both are taken from the first chunk added.
+    """
+
+    def __init__(self, k):
+        self.k = k
+        self.n = 0
+        self.shift = np.zeros(k)
+        self.y_shift = 0.0
+        self.xtx = np.zeros((k + 1, k + 1))
+        self.xty = np.zeros(k + 1)
+        self.yty = 0.0
+
+    def add(self, X, y):
+        """Fold in a chunk: ``X`` is ``(m, k)`` (or ``(m,)`` when k is 1)."""
+        X = np.asarray(X, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if X.ndim == 1:
+            X = X[:, None]
+        if X.shape != (y.size, self.k):
+            raise ValueError(f"Expected X of shape ({y.size}, {self.k}), got {X.shape}")
+        if self.n == 0 and y.size:
+            self.shift = X.mean(axis=0)
+            self.y_shift = float(y.mean())
+        Z = np.empty((y.size, self.k + 1))
+        Z[:, 0] = 1.0
+        np.subtract(X, self.shift, out=Z[:, 1:])
+        dy = y - self.y_shift
+        self.xtx += Z.T @ Z
+        self.xty += Z.T @ dy
+        self.yty += float(np.dot(dy, dy))
+        self.n += y.size
+
+    def shifted(self, shift, y_shift):
+        """``(xtx, xty, yty)`` of the same rows about another shift."""
+        # Each row of Z moves by d = [0, old shift - new shift], y by c
+        d = np.concatenate([[0.0], self.shift - shift])
+        c = self.y_shift - y_shift
+        column_sums = self.xtx[:, 0]
+        xtx = (self.xtx + np.outer(column_sums, d) + np.outer(d, column_sums)
+               + self.n * np.outer(d, d))
+        xty = self.xty + d * self.xty[0] + c * (column_sums + self.n * d)
+        yty = self.yty + 2 * c * self.xty[0] + self.n * c * c
+        return xtx, xty, yty
+
+    def merge(self, other):
+        if other.k != self.k:
+            raise ValueError("Cannot merge cross-products with different predictor counts")
+        if other.n == 0:
+            return
+        if self.n == 0:
+            self.shift = other.shift.copy()
+            self.y_shift = other.y_shift
+        xtx, xty, yty = other.shifted(self.shift, self.y_shift)
+        self.xtx += xtx
+        self.xty += xty
+        self.yty += yty
+        self.n += other.n
+
+    def solve(self):
+        """Solve the normal equations and return a :class:`MultipleRegressionResult`."""
+        beta = solve_normal_equations(self.xtx, self.xty)
+        r_squared = 0.0
+        if self.n:
+            mean_y = self.xty[0] / self.n
+            total = self.yty - self.n * mean_y * mean_y
+            residual = self.yty - float(beta @ self.xty)
+            # Cancellation in yᵀy - βᵀXᵀy can push a perfect fit a hair above 1
+            r_squared = min(1.0, 1.0 - residual / total) if total > 0 else 0.0
+        # y - y_shift = β₀' + Σ βⱼ(xⱼ - shiftⱼ), so only the intercept moves
+        beta[0] += self.y_shift - float(beta[1:] @ self.shift)
+        xtx, xty, _ = self.shifted(np.zeros(self.k), 0.0)
+        return MultipleRegressionResult(self.n, beta, float(r_squared), xtx, xty)
+
+
+def solve_normal_equations(xtx, xty):
+    """Return β with (XᵀX)β = Xᵀy, via Cholesky on the equilibrated matrix."""
+    diagonal = np.diag(xtx)
+    scale = np.where(diagonal > 0, 1.0 / np.sqrt(np.where(diagonal > 0, diagonal, 1.0)), 1.0)
+    scaled = xtx * scale[:, None] * scale[None, :]
+    rhs = xty * scale
+    try:
+        lower = np.linalg.cholesky(scaled)
+        # Two triangular solves: L z = rhs, Lᵀ w = z
+        z = np.linalg.solve(lower, rhs)
+        w = np.linalg.solve(lower.T, z)
+        if np.linalg.cond(lower) < 1e12:
+            return w * scale
+    except np.linalg.LinAlgError:
+        pass
+    w = np.linalg.lstsq(scaled, rhs, rcond=None)[0]
+    return w * scale
+
+
+def polynomial_features(x, degree):
+    """Columns x, x², ..., x^degree for a 1-D array ``x``."""
+    x = np.asarray(x, dtype=np.float64)
+    return np.power.outer(x, np.arange(1, degree + 1))
+
+
+def fit_multiple(X, y, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Fit y = β₀ + β₁x₁ + ... + βₖxₖ in chunked passes over ``X`` (n, k)."""
+    X = np.asarray(X)
+    k = 1 if X.ndim == 1 else X.shape[1]
+    acc = CrossProducts(k)
+    for start in range(0, len(y), chunk_rows):
+        acc.add(X[start:start + chunk_rows], y[start:start + chunk_rows])
+    return acc.solve()
+
+
+def polynomial_basis(x):
+    """``(center, scale)`` mapping the range of ``x`` onto t in [-1, 1]."""
+    if not x.size:
+        return 0.0, 1.0
+    low, high = float(x.min()), float(x.max())
+    return (low + high) / 2, (high - low) / 2 or 1.0
+
+
+def polynomial_cross_products(x, y, degree, center, scale, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """:class:`CrossProducts` of 1, t, ..., t^degree with t = (x - center) / scale."""
+    x = np.asarray(x, dtype=np.float64)
+    acc = CrossProducts(degree)
+    for start in range(0, len(y), chunk_rows):
+        stop = start + chunk_rows
+        t = (x[start:stop] - center) / scale
+        acc.add(polynomial_features(t, degree), y[start:stop])
+    return acc
+
+
+def rebase_polynomial(acc, center, scale, new_center, new_scale):
+    """Re-express polynomial cross-products in another t.
+
+    ``acc`` holds the features of t = (x - center) / scale; the result holds
+    those of u = (x - new_center) / new_scale = αt + δ for the same rows.
+    Each uʲ is Σᵢ C(j, i) αⁱ δʲ⁻ⁱ tⁱ, a fixed matrix M applied to the
+    features, so XᵀX becomes M XᵀX Mᵀ and Xᵀy becomes M Xᵀy exactly.
+    """
+    from math import comb
+
+    alpha = scale / new_scale
+    delta = (center - new_center) / new_scale
+    degree = acc.k
+    M = np.zeros((degree + 1, degree + 1))
+    for j in range(degree + 1):
+        for i in range(j + 1):
+            M[j, i] = comb(j, i) * alpha**i * delta**(j - i)
+    # The unshifted sums; t and u are O(1) over the data, so nothing cancels
+    xtx, xty, yty = acc.shifted(np.zeros(degree), acc.y_shift)
+    rebased = CrossProducts(degree)
+    rebased.n = acc.n
+    rebased.y_shift = acc.y_shift
+    rebased.xtx = M @ xtx @ M.T
+    rebased.xty = M @ xty
+    rebased.yty = yty
+    return rebased
+
+
+def fit_polynomial(x, y, degree, chunk_rows=DEFAULT_CHUNK_ROWS):
+    """Fit y = β₀ + β₁x + ... + β_d x^d, building the powers one chunk at a time.
+
+    Powers of raw x are badly conditioned as soon as x is far from zero, so
+    the system is solved in t = (x - center) / scale (see
+    :func:`polynomial_basis`), and the coefficients, ``xtx`` and ``xty`` of
+    the result all belong to the t system.  Evaluate the fit with
+    ``predict_polynomial(coefficients, x, center, scale)``; expanding to
+    powers of x (:func:`expand_polynomial`) cancels catastrophically for x
+    far from zero and is only meant for display.
+    """
+    if degree < 1:
+        raise ValueError("Polynomial degree must be at least 1")
+    x = np.asarray(x, dtype=np.float64)
+    center, scale = polynomial_basis(x)
+    acc = polynomial_cross_products(x, y, degree, center, scale, chunk_rows)
+    return acc.solve()._replace(center=center, scale=scale)
+
+
+def expand_polynomial(coefficients, center=0.0, scale=1.0):
+    """Coefficients of Σ γⱼ tʲ with t = (x - center) / scale as powers of x."""
+    in_t = np.polynomial.Polynomial(coefficients)
+    in_x = in_t(np.polynomial.Polynomial([-center / scale, 1.0 / scale]))
+    expanded = np.zeros(len(coefficients))
+    expanded[:in_x.coef.size] = in_x.coef
+    return expanded
+
+
+def predict_polynomial(coefficients, x, center=0.0, scale=1.0):
+    """Evaluate β₀ + β₁t + ... at t = (x - center) / scale with Horner's scheme."""
+    t = np.asarray(x, dtype=np.float64)
+    if center != 0.0 or scale != 1.0:
+        t = (t - center) / scale
+    result = np.full_like(t, coefficients[-1])
+    for c in coefficients[-2::-1]:
+        result *= t
+        result += c
+    return result
+
+
+_SUPERSCRIPTS = str.maketrans("0123456789", "⁰¹²³⁴⁵⁶⁷⁸⁹")
+
+
+def polynomial_equation(coefficients, precision=4):
+    """Format β as ``y = β₀ + β₁x + β₂x² ...``."""
+    text = f"y = {coefficients[0]:.{precision}f}"
+    for power, c in enumerate(coefficients[1:], start=1):
+        sign = "-" if c < 0 else "+"
+        term = "x" if power == 1 else "x" + str(power).translate(_SUPERSCRIPTS)
+        text += f" {sign} {abs(c):.{precision}f}{term}"
+    return text
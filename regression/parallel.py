@@ -0,0 +1,93 @@
+"""Multi-core reduction of the regression statistics for one huge dataset.
+
+The arrays are cut into chunks that are reduced on a thread pool.  numpy
+releases the GIL inside its reductions, so the threads run truly in parallel
+while reading the same arrays (or the same memory map) with no copies between
+workers.  Each chunk produces centred moments (see
+:class:`~regression.streaming.OnlineRegression`) and the partial results are
+combined pairwise in a balanced tree, which keeps the rounding error of the
+merge at O(log chunks) instead of O(chunks).
+"""
+
+import os
+from concurrent.futures import ThreadPoolExecutor
+
+import numpy as np
+
+from .engine import fit
+from .streaming import OnlineRegression
+
+DEFAULT_CHUNK_POINTS = 1 << 20
+# Below this many points threads cost more than they save
+MIN_PARALLEL_POINTS = 1 << 21
+
+
+def default_workers():
+    """Worker count from ``REGRESSION_WORKERS``, else the number of cores."""
+    value = os.environ.get("REGRESSION_WORKERS")
+    if value:
+        return max(1, int(value))
+    return os.cpu_count() or 1
+
+
+def chunk_moments(x, y):
+    """Centred moments of one chunk as an :class:`OnlineRegression`."""
+    acc = OnlineRegression()
+    acc.add_many(x, y)
+    return acc
+
+
+def pairwise_merge(accumulators):
+    """Combine accumulators in a balanced binary tree."""
+    accumulators = list(accumulators)
+    if not accumulators:
+        return OnlineRegression()
+    while len(accumulators) > 1:
+        merged = []
+        for i in range(0, len(accumulators) - 1, 2):
+            accumulators[i].merge(accumulators[i + 1])
+            merged.append(accumulators[i])
+        if len(accumulators) % 2:
+            merged.append(accumulators[-1])
+        accumulators = merged
+    return accumulators[0]
+
+
+def _spans(n, workers, chunk_points):
+    chunks = max(workers, -(-n // chunk_points))
+    edges = np.linspace(0, n, chunks + 1).astype(np.intp)
+    return list(zip(edges[:-1].tolist(), edges[1:].tolist()))
+
+
+def parallel_fit(x, y, workers=None, chunk_points=DEFAULT_CHUNK_POINTS, method="centered"):
+    """Fit y = a + bx with the reduction spread over ``workers`` threads.
+
+    Small inputs, or a single worker, fall back to :func:`regression.fit`
+    with ``method``; the threaded path always uses centred moments.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional arrays of equal length")
+    workers = workers or default_workers()
+    if workers == 1 or x.size < MIN_PARALLEL_POINTS:
+        return fit(x, y, method)
+
+    spans = _spans(x.size, workers, chunk_points)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        parts = pool.map(lambda span: chunk_moments(x[span[0]:span[1]], y[span[0]:span[1]]), spans)
+        return pairwise_merge(parts).result()
+
+
+def parallel_fit_pairs(pairs, workers=None, chunk_points=DEFAULT_CHUNK_POINTS):
+    """Like :func:`parallel_fit` for an ``(n, 2)`` array such as a memory map."""
+    workers = workers or default_workers()
+
+    def reduce_span(span):
+        block = np.asarray(pairs[span[0]:span[1]], dtype=np.float64)
+        return chunk_moments(block[:, 0], block[:, 1])
+
+    # Spans no larger than chunk_points keep each worker's copy bounded
+    spans = _spans(len(pairs), 1, chunk_points)
+    with ThreadPoolExecutor(max_workers=workers) as pool:
+        return pairwise_merge(pool.map(reduce_span, spans)).result()
@@ -0,0 +1,185 @@
+"""Fast parser for pasted or loaded (x, y) data.
+
+Two layouts are understood:
+
+* the Python-style list the app has always shown, ``[(2, 7), (4, 11)]``
+  (square brackets or parentheses, with or without the outer list), and
+* plain two-column text separated by commas, semicolons, tabs or spaces,
+  optionally with a header line.
+
+The text is validated and converted chunk by chunk with compiled regular
+expressions and ``str.split``, so no Python AST or list of tuples is built.
+Malformed input raises :class:`ParseError` carrying the line and column of
+the first problem.
+"""
+
+import re
+
+import numpy as np
+
+DEFAULT_CHUNK_SIZE = 1 << 16  # characters per chunk
+
+# Every pattern below can match a given text in only one way.  With nested
+# repetition, any ambiguity (say a number that splits into digits several ways,
+# or optional spaces on both sides of an optional comma) would let a failing
+# match backtrack exponentially in the number of rows.
+_NUMBER = r"[-+]?(?:\d+(?:\.\d*)?|\.\d+)(?:[eE][-+]?\d+)?"
+_PAIR = rf"[(\[]\s*{_NUMBER}\s*,\s*{_NUMBER}\s*[)\]]"
+_PAIR_RE = re.compile(_PAIR)
+_PAIR_CHUNK_RE = re.compile(rf"\s*(?:{_PAIR}\s*,\s*)*(?:{_PAIR}\s*(?:,\s*)?)?")
+
+_SEPARATOR = r"(?:[ \t]*[,;][ \t]*|[ \t]+)"
+_ROW = rf"[ \t]*(?:{_NUMBER}{_SEPARATOR}{_NUMBER}[ \t]*(?:[,;][ \t]*)?)?\r?"
+_ROW_RE = re.compile(_ROW)
+_ROWS_CHUNK_RE = re.compile(rf"(?:{_ROW}\n)*{_ROW}")
+_NUMBER_RE = re.compile(_NUMBER)
+_FIELD_RE = re.compile(r"[^,;\s]+")
+
+_PAIR_BOUNDARY_RE = re.compile(r"[)\]]\s*,")
+_ROW_BOUNDARY_RE = re.compile(r"\n")
+
+_TO_SPACES = str.maketrans("()[],;", "      ")
+
+
+class ParseError(ValueError):
+    """Raised for malformed input; ``line`` and ``column`` are 1-based."""
+
+    def __init__(self, message, line, column):
+        super().__init__(f"{message} (line {line}, column {column})")
+        self.line = line
+        self.column = column
+
+
+def _error_at(text, pos, message):
+    line = text.count("\n", 0, pos) + 1
+    column = pos - (text.rfind("\n", 0, pos) + 1) + 1
+    return ParseError(message, line, column)
+
+
+def _tokens_to_array(chunk):
+    tokens = chunk.translate(_TO_SPACES).split()
+    return np.fromiter(map(float, tokens), dtype=np.float64, count=len(tokens))
+
+
+def _split_points(text, start, end, chunk_size, boundary):
+    """Yield (chunk_start, chunk_end) spans that end just after a ``boundary`` match."""
+    while start < end:
+        cut = start + chunk_size
+        match = boundary.search(text, cut, end) if cut < end else None
+        if match is None:
+            yield start, end
+            return
+        yield start, match.end()
+        start = match.end()
+
+
+def _find_pair_error(text, start, end):
+    pos = start
+    while True:
+        while pos < end and text[pos].isspace():
+            pos += 1
+        if pos >= end:
+            return None
+        match = _PAIR_RE.match(text, pos, end)
+        if match is None:
+            return _error_at(text, pos, "Expected an (x, y) pair of numbers")
+        pos = match.end()
+        while pos < end and text[pos].isspace():
+            pos += 1
+        if pos < end:
+            if text[pos] != ",":
+                return _error_at(text, pos, "Expected ',' between pairs")
+            pos += 1
+
+
+def _find_row_error(text, start, end):
+    line_start = start
+    while line_start <= end:
+        line_end = text.find("\n", line_start, end)
+        if line_end < 0:
+            line_end = end
+        if _ROW_RE.fullmatch(text, line_start, line_end) is None:
+            fields = list(_FIELD_RE.finditer(text, line_start, line_end))
+            for field in fields[:2]:
+                if _NUMBER_RE.fullmatch(field.group()) is None:
+                    return _error_at(text, field.start(), f"Not a number: {field.group()!r}")
+            if len(fields) < 2:
+                return _error_at(text, line_end, "Expected two columns (x and y)")
+            return _error_at(text, fields[2].start(), "Unexpected extra column")
+        line_start = line_end + 1
+    return None
+
+
+def _parse_pair_list(text, start, end, chunk_size, progress):
+    arrays = []
+    for chunk_start, chunk_end in _split_points(text, start, end, chunk_size, _PAIR_BOUNDARY_RE):
+        if progress is not None:
+            progress(chunk_start / len(text))
+        if _PAIR_CHUNK_RE.fullmatch(text, chunk_start, chunk_end) is None:
+            raise _find_pair_error(text, chunk_start, chunk_end) or _error_at(
+                text, chunk_start, "Invalid data format")
+        arrays.append(_tokens_to_array(text[chunk_start:chunk_end]))
+    return arrays
+
+
+def _parse_rows(text, start, end, chunk_size, progress):
+    # A first line without a single number in it is a column header; one with
+    # a mistyped number ("1O, 2") is a bad row and is reported as such
+    header = start
+    newline = text.find("\n", start, end)
+    line_end = end if newline < 0 else newline
+    if not any(_NUMBER_RE.fullmatch(field) for field in _FIELD_RE.findall(text, start, line_end)):
+        start = end if newline < 0 else newline + 1
+
+    arrays = []
+    for chunk_start, chunk_end in _split_points(text, start, end, chunk_size, _ROW_BOUNDARY_RE):
+        if progress is not None:
+            progress(chunk_start / len(text))
+        stop = chunk_end - 1 if text[chunk_end - 1] == "\n" else chunk_end
+        if _ROWS_CHUNK_RE.fullmatch(text, chunk_start, stop) is None:
+            raise _find_row_error(text, chunk_start, stop) or _error_at(
+                text, chunk_start, "Invalid data format")
+        arrays.append(_tokens_to_array(text[chunk_start:chunk_end]))
+    if not any(array.size for array in arrays):
+        raise _error_at(text, header, "Invalid data format: no data rows")
+    return arrays
+
+
+def parse_pairs(text, chunk_size=DEFAULT_CHUNK_SIZE, progress=None):
+    """Parse ``text`` into two contiguous float64 arrays ``(x, y)``.
+
+    ``progress``, if given, is called with the fraction of the text consumed
+    before each chunk; an exception raised from it aborts the parse.
+    """
+    start = 0
+    end = len(text)
+    while start < end and text[start].isspace():
+        start += 1
+    while end > start and text[end - 1].isspace():
+        end -= 1
+    if start == end:
+        return np.empty(0), np.empty(0)
+
+    opener = text[start]
+    if opener in "[(":
+        inner = start + 1
+        while inner < end and text[inner].isspace():
+            inner += 1
+        # "[(1, 2), ...]" or "((1, 2), ...)": strip the outer brackets
+        if inner == end or text[inner] in "[(]":
+            closer = "]" if opener == "[" else ")"
+            if text[end - 1] != closer:
+                raise _error_at(text, end, f"Expected closing '{closer}'")
+            start, end = start + 1, end - 1
+        arrays = _parse_pair_list(text, start, end, chunk_size, progress)
+    else:
+        arrays = _parse_rows(text, start, end, chunk_size, progress)
+
+    values = np.concatenate(arrays) if arrays else np.empty(0)
+    return np.ascontiguousarray(values[0::2]), np.ascontiguousarray(values[1::2])
+
+
+def load_pairs(path, chunk_size=DEFAULT_CHUNK_SIZE):
+    """Read a text file of (x, y) data and parse it with :func:`parse_pairs`."""
+    with open(path, encoding="utf-8-sig") as f:
+        return parse_pairs(f.read(), chunk_size)
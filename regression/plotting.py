@@ -0,0 +1,252 @@
+"""Point rendering that stays responsive for very large datasets.
+
+Drawing every point as its own marker is fine for the few dozen pairs typed
+into the app but freezes the window for hundreds of thousands.  Above a
+threshold the points are either binned into a density image (one raster,
+whatever the size of the data) or reduced with Largest-Triangle-Three-Buckets
+to a few thousand representatives.  Only the display is reduced; the fit is
+always computed from the full arrays.
+"""
+
+import os
+
+import numpy as np
+
+RENDER_MODES = ("auto", "scatter", "density", "downsample")
+DEFAULT_SCATTER_LIMIT = 100_000
+DENSITY_BINS = (400, 300)
+DOWNSAMPLE_POINTS = 5_000
+
+
+def default_scatter_limit():
+    """Scatter limit from ``REGRESSION_SCATTER_LIMIT``, else :data:`DEFAULT_SCATTER_LIMIT`."""
+    value = os.environ.get("REGRESSION_SCATTER_LIMIT")
+    if value:
+        return max(1, int(value))
+    return DEFAULT_SCATTER_LIMIT
+
+
+def lttb_indices(x, y, n_out):
+    """Indices of the ``n_out`` points kept by Largest-Triangle-Three-Buckets.
+
+    ``x`` must be sorted ascending.  The first and last points are always kept.
+    """
+    n = x.size
+    if n_out >= n or n_out < 3:
+        return np.arange(n)
+
+    edges = np.linspace(1, n - 1, n_out - 1).astype(np.intp)
+    indices = np.empty(n_out, dtype=np.intp)
+    indices[0] = 0
+    indices[-1] = n - 1
+    a = 0
+    for i in range(n_out - 2):
+        start, end = edges[i], edges[i + 1]
+        next_end = edges[i + 2] if i + 2 < edges.size else n
+        avg_x = x[end:next_end].mean()
+        avg_y = y[end:next_end].mean()
+        # Twice the triangle area between the previous pick, each candidate and the next bucket's mean
+        area = np.abs((x[a] - avg_x) * (y[start:end] - y[a])
+                      - (x[a] - x[start:end]) * (avg_y - y[a]))
+        a = start + int(np.argmax(area))
+        indices[i + 1] = a
+    return indices
+
+
+def downsample(x, y, n_out=DOWNSAMPLE_POINTS):
+    """Return an LTTB-reduced copy of the points, ordered by x."""
+    if x.size <= n_out:
+        return x, y
+    order = np.argsort(x, kind="stable")
+    xs = x[order]
+    ys = y[order]
+    keep = lttb_indices(xs, ys, n_out)
+    return xs[keep], ys[keep]
+
+
+def density_grid(x, y, bins=DENSITY_BINS):
+    """Bin the points into a ``(ny, nx)`` count grid plus its data extent."""
+    nx, ny = bins
+    x_min, x_max = float(x.min()), float(x.max())
+    y_min, y_max = float(y.min()), float(y.max())
+    if x_max == x_min:
+        x_min, x_max = x_min - 0.5, x_max + 0.5
+    if y_max == y_min:
+        y_min, y_max = y_min - 0.5, y_max + 0.5
+
+    ix = ((x - x_min) * (nx / (x_max - x_min))).astype(np.intp)
+    iy = ((y - y_min) * (ny / (y_max - y_min))).astype(np.intp)
+    np.minimum(ix, nx - 1, out=ix)
+    np.minimum(iy, ny - 1, out=iy)
+    iy *= nx
+    iy += ix
+    counts = np.bincount(iy, minlength=nx * ny).reshape(ny, nx)
+    return counts, (x_min, x_max, y_min, y_max)
+
+
+def resolve_mode(n, mode="auto", scatter_limit=DEFAULT_SCATTER_LIMIT):
+    """Pick the concrete rendering mode for ``n`` points."""
+    if mode not in RENDER_MODES:
+        raise ValueError(f"Unknown render mode {mode!r}; expected one of {RENDER_MODES}")
+    if mode == "auto":
+        return "scatter" if n <= scatter_limit else "density"
+    return mode
+
+
+def draw_points(ax, x, y, mode="auto", scatter_limit=DEFAULT_SCATTER_LIMIT,
+                color="blue", size=100, label="Data Points"):
+    """Draw the data on ``ax`` with the mode best suited to its size.
+
+    Returns the artist that was added.
+    """
+    mode = resolve_mode(x.size, mode, scatter_limit)
+    if mode == "density":
+        counts, extent = density_grid(x, y)
+        # Log scale so sparse outliers stay visible next to the dense core
+        image = np.ma.masked_equal(np.log1p(counts), 0)
+        artist = ax.imshow(image, extent=extent, origin="lower",
+                           aspect="auto", cmap="Blues", interpolation="nearest")
+        # imshow has no legend handle, so add an empty proxy marker
+        ax.scatter([], [], color=color, marker="s", label=f"{label} (density, n={x.size:,})")
+        return artist
+    if mode == "downsample":
+        x, y = downsample(x, y)
+        label = f"{label} ({x.size:,} shown)"
+        size = min(size, 10)
+    return ax.scatter(x, y, color=color, s=size, label=label)
+
+
+class RegressionPlot:
+    """Persistent scatter + fit-line artists on one axes, updated in place.
+
+    The axes decorations are created once.  Each update only swaps the data
+    of the existing artists; when the view limits did not change the axes
+    are redrawn by blitting the animated artists over a cached background,
+    otherwise a single full draw refreshes everything.
+    """
+
+    def __init__(self, ax, canvas, color="blue", size=100, label="Data Points",
+                 title="Linear Regression: y = a + bx"):
+        from matplotlib.lines import Line2D
+
+        self.ax = ax
+        self.canvas = canvas
+        self.size = size
+        self.label = label
+        self._background = None
+
+        ax.set_title(title, fontsize=22)
+        ax.set_xlabel("x", fontsize=18)
+        ax.set_ylabel("y", fontsize=18)
+        ax.grid(True)
+
+        (self.line,) = ax.plot([], [], color="red", animated=True)
+        self.points = ax.scatter(np.empty(0), np.empty(0), color=color, s=size, animated=True)
+        self.image = None
+        self._points_handle = Line2D([], [], color=color, marker="o", linestyle="None")
+        self.legend = ax.legend([self.line, self._points_handle], ["", label], loc="upper left")
+        self.legend.set_animated(True)
+
+        canvas.mpl_connect("draw_event", self._on_draw)
+
+    @property
+    def _animated(self):
+        artists = [self.line, self.points, self.legend]
+        if self.image is not None:
+            artists.insert(0, self.image)
+        return artists
+
+    def update(self, x, y, result, mode="auto", scatter_limit=DEFAULT_SCATTER_LIMIT,
+               rescale="fit", curve=None):
+        """Show new data and fit.
+
+        ``rescale="fit"`` sets the view to the data, ``"grow"`` only widens it
+        when points fall outside (useful for appended live data).  ``curve``
+        is an optional ``(x_line, y_line, label)`` drawn instead of the
+        straight line from ``result``, e.g. a polynomial fit.
+        """
+        mode = resolve_mode(x.size, mode, scatter_limit)
+        b, a = result.slope, result.intercept
+        label = self.label
+
+        if mode == "density":
+            counts, extent = density_grid(x, y)
+            image = np.ma.masked_equal(np.log1p(counts), 0)
+            if self.image is None:
+                self.image = self.ax.imshow(image, extent=extent, origin="lower", aspect="auto",
+                                            cmap="Blues", interpolation="nearest",
+                                            animated=True, zorder=0)
+            else:
+                self.image.set_data(image)
+                self.image.set_extent(extent)
+                self.image.set_clim(0, image.max() if image.count() else 1)
+            self.image.set_visible(True)
+            self.points.set_visible(False)
+            label = f"{label} (density, n={x.size:,})"
+        else:
+            shown_x, shown_y = (x, y) if mode == "scatter" else downsample(x, y)
+            self.points.set_offsets(np.column_stack((shown_x, shown_y)))
+            self.points.set_sizes([self.size if mode == "scatter" else min(self.size, 10)])
+            self.points.set_visible(True)
+            if self.image is not None:
+                self.image.set_visible(False)
+            if mode == "downsample":
+                label = f"{label} ({shown_x.size:,} shown)"
+
+        line_label = f"Best Fit Line: y = {b:.3f}x + {a:.3f}"
+        if curve is not None:
+            x_line, y_line, line_label = curve
+            self.line.set_data(x_line, y_line)
+        elif x.size:
+            x_line = np.array([x.min(), x.max()])
+            self.line.set_data(x_line, b * x_line + a)
+        else:
+            self.line.set_data([], [])
+        line_text, points_text = self.legend.get_texts()
+        line_text.set_text(line_label)
+        points_text.set_text(label)
+
+        if self._set_limits(x, y, self.line.get_ydata(), rescale) or self._background is None:
+            self.canvas.draw_idle()
+        else:
+            self._blit()
+
+    def _set_limits(self, x, y, y_line, rescale):
+        """Apply new view limits; return True when they changed."""
+        if x.size == 0:
+            return False
+        bounds = []
+        for values, extra in ((x, ()), (y, y_line)):
+            low = min([float(values.min()), *extra])
+            high = max([float(values.max()), *extra])
+            pad = (high - low) * 0.05 or 0.5
+            bounds.append((low - pad, high + pad))
+        (x0, x1), (y0, y1) = bounds
+        old_x, old_y = self.ax.get_xlim(), self.ax.get_ylim()
+        if rescale == "grow":
+            if old_x[0] <= x0 and x1 <= old_x[1] and old_y[0] <= y0 and y1 <= old_y[1]:
+                return False
+            x0, x1 = min(x0, old_x[0]), max(x1, old_x[1])
+            y0, y1 = min(y0, old_y[0]), max(y1, old_y[1])
+        if (x0, x1) == old_x and (y0, y1) == old_y:
+            return False
+        self.ax.set_xlim(x0, x1)
+        self.ax.set_ylim(y0, y1)
+        return True
+
+    def _on_draw(self, event):
+        if event.canvas is not self.canvas:
+            return
+        self._background = self.canvas.copy_from_bbox(self.ax.bbox)
+        self._draw_animated()
+
+    def _draw_animated(self):
+        for artist in self._animated:
+            if artist.get_visible():
+                self.ax.draw_artist(artist)
+
+    def _blit(self):
+        self.canvas.restore_region(self._background)
+        self._draw_animated()
+        self.canvas.blit(self.ax.bbox)
+        self.canvas.flush_events()
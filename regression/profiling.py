@@ -0,0 +1,109 @@
+"""Per-stage timing, memory readings and optional cProfile dumps.
+
+A :class:`StageTimer` follows one analysis through its stages, which may run
+on different threads (parsing on the worker, drawing on the Tk thread).  Set
+``REGRESSION_PROFILE`` to a file name to also collect a cProfile of every
+stage of the most recent run; it is written there in ``pstats`` format and
+can be inspected with ``python -m pstats <file>`` or snakeviz.
+"""
+
+import cProfile
+import os
+import pstats
+import sys
+import threading
+import time
+from contextlib import contextmanager
+
+PROFILE_ENV = "REGRESSION_PROFILE"
+
+
+def current_rss():
+    """Resident set size of this process in bytes, or None if unknown."""
+    try:
+        if sys.platform.startswith("linux"):
+            with open("/proc/self/statm") as f:
+                return int(f.read().split()[1]) * os.sysconf("SC_PAGE_SIZE")
+        if sys.platform == "win32":
+            import ctypes
+            from ctypes import wintypes
+
+            class Counters(ctypes.Structure):
+                _fields_ = [("cb", wintypes.DWORD), ("PageFaultCount", wintypes.DWORD)] + [
+                    (name, ctypes.c_size_t) for name in (
+                        "PeakWorkingSetSize", "WorkingSetSize", "QuotaPeakPagedPoolUsage",
+                        "QuotaPagedPoolUsage", "QuotaPeakNonPagedPoolUsage",
+                        "QuotaNonPagedPoolUsage", "PagefileUsage", "PeakPagefileUsage")]
+
+            counters = Counters()
+            counters.cb = ctypes.sizeof(counters)
+            process = ctypes.windll.kernel32.GetCurrentProcess()
+            if ctypes.windll.psapi.GetProcessMemoryInfo(process, ctypes.byref(counters), counters.cb):
+                return counters.WorkingSetSize
+            return None
+        import resource
+        # ru_maxrss is a peak, not the current size, but it is all macOS offers cheaply
+        return resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    except (OSError, ValueError, AttributeError, ImportError):
+        return None
+
+
+class StageTimer:
+    """Wall time and RSS change of each named stage of one run."""
+
+    def __init__(self, profile_path=None):
+        self.stages = []  # (name, milliseconds, rss delta in bytes or None)
+        self.profile_path = profile_path if profile_path is not None else os.environ.get(PROFILE_ENV)
+        self._profiles = []
+        self._lock = threading.Lock()
+
+    @contextmanager
+    def stage(self, name):
+        profile = None
+        if self.profile_path:
+            profile = cProfile.Profile()
+            profile.enable()
+        rss_before = current_rss()
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            elapsed = (time.perf_counter() - start) * 1e3
+            rss_after = current_rss()
+            if profile is not None:
+                profile.disable()
+            delta = rss_after - rss_before if rss_before is not None and rss_after is not None else None
+            with self._lock:
+                self.stages.append((name, elapsed, delta))
+                if profile is not None:
+                    self._profiles.append(profile)
+
+    @property
+    def total_ms(self):
+        return sum(ms for _, ms, _ in self.stages)
+
+    def summary(self):
+        """One-line readout such as ``parse 12.1 ms · plot 80.4 ms · RSS 120 MiB``."""
+        parts = []
+        for name, ms, delta in self.stages:
+            text = f"{name} {ms:.1f} ms"
+            if delta:
+                text += f" ({delta / 2**20:+.1f} MiB)"
+            parts.append(text)
+        parts.append(f"total {self.total_ms:.1f} ms")
+        rss = current_rss()
+        if rss is not None:
+            parts.append(f"RSS {rss / 2**20:.0f} MiB")
+        return " · ".join(parts)
+
+    def dump_profile(self):
+        """Write the combined cProfile of all stages; return the path or None."""
+        with self._lock:
+            profiles = list(self._profiles)
+        if not self.profile_path or not profiles:
+            return None
+        stats = pstats.Stats(profiles[0])
+        for profile in profiles[1:]:
+            stats.add(profile)
+        stats.dump_stats(self.profile_path)
+        return self.profile_path
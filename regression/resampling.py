@@ -0,0 +1,151 @@
+"""Bootstrap confidence intervals and permutation p-values for a line fit.
+
+Resamples are evaluated a batch at a time as matrices instead of one by one:
+
+* bootstrap: a batch × n matrix of random row indices is turned into a
+  matrix of draw counts by a single ``bincount``, and one matrix product
+  with the per-point features [x, y, x², y², xy] yields the sums of every
+  resample in the batch;
+* permutation: a batch × n matrix of copies of y is shuffled row by row in
+  one ``Generator.permuted`` call, and one matrix-vector product gives Σxy
+  for each shuffle (Σx, Σy, Σx², Σy² do not change under permutation, so
+  slope and r follow directly).
+
+The data are centred first, so the sums do not cancel for large offsets.
+Batches are sized to hold about ``BATCH_ELEMENTS`` indices, and the
+resamples can be split across a process pool.
+"""
+
+from concurrent.futures import ProcessPoolExecutor
+from typing import NamedTuple
+
+import numpy as np
+
+DEFAULT_RESAMPLES = 10_000
+DEFAULT_CONFIDENCE = 0.95
+BATCH_ELEMENTS = 1 << 23
+
+
+class IntervalResult(NamedTuple):
+    resamples: int
+    confidence: float
+    slope_ci: tuple
+    intercept_ci: tuple
+    r_ci: tuple
+    slope_p: float       # permutation test of no association
+    intercept_p: float   # bootstrap test of a = 0
+    r_p: float           # permutation test; the same statistic as the slope's
+
+
+def _lines_from_sums(n, sums):
+    # Rows of (Σx, Σy, Σx², Σy², Σxy) -> columns of slope, intercept, r
+    sum_x, sum_y, sum_x2, sum_y2, sum_xy = sums.T
+    mean_x = sum_x / n
+    mean_y = sum_y / n
+    sxx = sum_x2 - sum_x * mean_x
+    syy = sum_y2 - sum_y * mean_y
+    sxy = sum_xy - sum_x * mean_y
+    # As in engine.result_from_sums: no spread in x gives slope 0, none in x or y gives r 0
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        r_denominator = sxx * syy
+        r = np.where(r_denominator > 0, sxy / np.sqrt(r_denominator), 0.0)
+    return np.column_stack([slope, mean_y - slope * mean_x, r])
+
+
+def _resample_part(x, y, resamples, seed, progress=None):
+    """Bootstrap lines and the permutation exceedance count for one share of the resamples.
+
+    ``x`` and ``y`` are centred.  Returns ``(lines, exceedances)`` where
+    ``lines`` holds slope, intercept and r per bootstrap resample.
+    """
+    rng = np.random.default_rng(seed)
+    n = x.size
+    batch = max(1, BATCH_ELEMENTS // n)
+    features = np.column_stack([x, y, x * x, y * y, x * y])
+
+    lines = np.empty((resamples, 3))
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        rows = rng.integers(0, n, (size, n), dtype=np.intp)
+        # Row k of counts holds how often each point was drawn in resample k;
+        # offsetting row k by k·n lets one bincount count every resample at once
+        rows += np.arange(0, size * n, n, dtype=np.intp)[:, None]
+        counts = np.bincount(rows.ravel(), minlength=size * n).reshape(size, n)
+        sums = counts @ features
+        lines[start:start + size] = _lines_from_sums(n, sums)
+        if progress is not None:
+            progress(0.5 * (start + size) / resamples)
+
+    observed = abs(float(np.dot(x, y)))
+    exceedances = 0
+    for start in range(0, resamples, batch):
+        size = min(batch, resamples - start)
+        # Shuffle copies of y directly, every row independently in one call;
+        # shuffling indices and gathering y through them costs three times as much
+        shuffled = np.tile(y, (size, 1))
+        rng.permuted(shuffled, axis=1, out=shuffled)
+        permuted_sxy = shuffled @ x
+        # Tolerate rounding so ties with the observed statistic count as exceeding it
+        exceedances += int(np.count_nonzero(np.abs(permuted_sxy) >= observed * (1 - 1e-12)))
+        if progress is not None:
+            progress(0.5 + 0.5 * (start + size) / resamples)
+    return lines, exceedances
+
+
+def confidence_intervals(x, y, resamples=DEFAULT_RESAMPLES, confidence=DEFAULT_CONFIDENCE,
+                         seed=0, workers=1, progress=None):
+    """Percentile bootstrap intervals and p-values for slope, intercept and r.
+
+    With ``workers`` > 1 the resamples are split across that many processes,
+    each with an independent random stream spawned from ``seed``.
+    ``progress`` is called with the fraction done.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional arrays of equal length")
+    if x.size < 3:
+        raise ValueError("Confidence intervals need at least three points.")
+    mean_x = float(x.mean())
+    mean_y = float(y.mean())
+    xc = x - mean_x
+    yc = y - mean_y
+
+    workers = max(1, min(workers, resamples))
+    seeds = np.random.SeedSequence(seed).spawn(workers)
+    shares = [resamples // workers + (i < resamples % workers) for i in range(workers)]
+    if workers == 1:
+        parts = [_resample_part(xc, yc, resamples, seeds[0], progress)]
+    else:
+        parts = []
+        with ProcessPoolExecutor(max_workers=workers) as executor:
+            futures = [executor.submit(_resample_part, xc, yc, share, child)
+                       for share, child in zip(shares, seeds)]
+            for done, future in enumerate(futures, start=1):
+                parts.append(future.result())
+                if progress is not None:
+                    progress(done / workers)
+
+    lines = np.concatenate([part[0] for part in parts])
+    exceedances = sum(part[1] for part in parts)
+    # Back from centred coordinates: a = ȳ + a_c - b·x̄
+    lines[:, 1] += mean_y - lines[:, 0] * mean_x
+
+    tail = 100 * (1 - confidence) / 2
+    intervals = []
+    for column, name in enumerate(("slope", "intercept", "r")):
+        # Each statistic keeps every resample where it is finite
+        values = lines[:, column]
+        values = values[np.isfinite(values)]
+        if values.size == 0:
+            raise ValueError(f"No bootstrap resample gave a finite {name}.")
+        low, high = np.percentile(values, [tail, 100 - tail])
+        intervals.append((float(low), float(high)))
+        if name == "intercept":
+            below = np.count_nonzero(values <= 0)
+            above = np.count_nonzero(values >= 0)
+            intercept_p = min(1.0, 2 * (1 + int(min(below, above))) / (values.size + 1))
+    p_association = (1 + exceedances) / (resamples + 1)
+    return IntervalResult(resamples, confidence, *intervals,
+                          p_association, intercept_p, p_association)
@@ -0,0 +1,356 @@
+"""Outlier-resistant line fits: Theil–Sen, Huber and RANSAC.
+
+All three stay usable on a million points:
+
+* Theil–Sen takes the median of the n(n-1)/2 pairwise slopes without ever
+  forming them.  The slopes below a value t are exactly the pairs that swap
+  order between sorting by x and sorting by y - t·x, so they can be counted in
+  O(n log n).  Random samples drawn from the slopes inside the current bracket
+  narrow it down until the few slopes left can be listed and selected.
+* Huber is iteratively reweighted least squares; every iteration is one
+  vectorized pass.
+* RANSAC scores whole batches of two-point candidate lines at once on a
+  subsample, then checks the best candidate against all points.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+from .engine import fit
+
+ROBUST_METHODS = ("theil-sen", "huber", "ransac")
+
+# Bracket sizes (in slopes) small enough to list outright, per data point
+_ENUMERATE_PER_POINT = 4
+_MAD_TO_SIGMA = 1.4826
+# Subsample sizes for Huber's starting fit and RANSAC's candidate scoring
+_START_POINTS = 2000
+# Residuals within this many robust standard deviations count as inliers
+_INLIER_SIGMAS = 2.5
+
+
+class RobustResult(NamedTuple):
+    method: str
+    n: int
+    slope: float
+    intercept: float
+    scale: float     # robust residual scale (MAD-based σ estimate)
+    inliers: int     # points the fit treats as regular data
+
+
+def _mad_scale(residuals):
+    return float(_MAD_TO_SIGMA * np.median(np.abs(residuals - np.median(residuals))))
+
+
+def _index_dtype(n):
+    return np.int32 if n < 2 ** 31 else np.int64
+
+
+def _inversion_levels(ranks):
+    """Walk the pairs (a, b), a before b, with ranks[a] > ranks[b], by bit level.
+
+    This is an MSD radix sort of ``ranks`` that keeps equal prefixes in
+    sequence order.  At each bit, every element whose bit is 0 is inverted
+    with the 1-bit elements of its group that precede it; after the stable
+    partition those are the first ``count`` ones of the group.  Yields
+    ``(zero_ids, counts, ones_start, new_seq)`` so callers can sample or list
+    the pairs (as ids ``zero_ids`` and ``new_seq[ones_start + i]``).
+    """
+    n = ranks.size
+    dtype = _index_dtype(n)
+    seq = np.arange(n, dtype=dtype)
+    r = ranks.astype(dtype)
+    positions = np.arange(n, dtype=dtype)
+    for b in range(max(int(n - 1).bit_length(), 1) - 1, -1, -1):
+        # ranks are a permutation of 0..n-1, so group P (ranks with r >> (b+1) == P)
+        # starts at P·2^(b+1) and every group before it holds 2^b zeros and 2^b ones
+        prefix = r >> (b + 1)
+        bit = (r >> b) & 1
+        ones_in_group_before = np.cumsum(bit, dtype=dtype) - bit - (prefix << b)
+        group_start = prefix << (b + 1)
+        ones_start = group_start + np.minimum(1 << b, n - group_start)
+
+        is_zero = bit == 0
+        new_positions = np.where(is_zero, positions - ones_in_group_before,
+                                 ones_start + ones_in_group_before)
+        new_seq = np.empty_like(seq)
+        new_seq[new_positions] = seq
+        new_r = np.empty_like(r)
+        new_r[new_positions] = r
+
+        yield seq[is_zero], ones_in_group_before[is_zero], ones_start[is_zero], new_seq
+        seq, r = new_seq, new_r
+
+
+def count_inversions(ranks):
+    """Number of pairs out of order in a permutation of 0..n-1, in O(n log n).
+
+    The same radix walk as :func:`_inversion_levels`, keeping only the ranks.
+    """
+    n = ranks.size
+    dtype = _index_dtype(n)
+    r = ranks.astype(dtype)
+    positions = np.arange(n, dtype=dtype)
+    total = 0
+    for b in range(max(int(n - 1).bit_length(), 1) - 1, -1, -1):
+        prefix = r >> (b + 1)
+        bit = (r >> b) & 1
+        ones_in_group_before = np.cumsum(bit, dtype=dtype) - bit - (prefix << b)
+        total += int(ones_in_group_before.sum(dtype=np.int64)) - int(np.dot(bit, ones_in_group_before.astype(np.int64)))
+        group_start = prefix << (b + 1)
+        ones_start = group_start + np.minimum(1 << b, n - group_start)
+        new_positions = np.where(bit == 0, positions - ones_in_group_before,
+                                 ones_start + ones_in_group_before)
+        new_r = np.empty_like(r)
+        new_r[new_positions] = r
+        r = new_r
+    return total
+
+
+def _inverted_pairs(ranks, size=None, rng=None, total=None):
+    """All inverted pairs as two id arrays, or ``size`` of them drawn at random.
+
+    Sampling needs the number of inversions; pass it as ``total`` when known.
+    """
+    offsets = None
+    if size is not None:
+        if total is None:
+            total = count_inversions(ranks)
+        offsets = np.sort(rng.integers(0, total, size))
+    firsts, seconds = [], []
+    base = 0
+    for zero_ids, counts, ones_start, new_seq in _inversion_levels(ranks):
+        counts = counts.astype(np.int64)
+        ends = np.cumsum(counts)
+        level_total = int(ends[-1]) if ends.size else 0
+        if level_total == 0:
+            continue
+        if offsets is None:
+            index = np.repeat(np.arange(counts.size), counts)
+            within = np.arange(level_total) - (ends - counts)[index]
+        else:
+            local = offsets[(offsets >= base) & (offsets < base + level_total)] - base
+            index = np.searchsorted(ends, local, side="right")
+            within = local - (ends - counts)[index]
+        firsts.append(zero_ids[index])
+        seconds.append(new_seq[ones_start[index] + within])
+        base += level_total
+    if not firsts:
+        return np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64)
+    return np.concatenate(firsts), np.concatenate(seconds)
+
+
+def _order_at(xs, ys, t):
+    # Sorting by y - t·x; ties keep x order, so equal-x pairs never swap
+    return np.argsort(ys - t * xs, kind="stable")
+
+
+def _ranks(order):
+    ranks = np.empty_like(order)
+    ranks[order] = np.arange(order.size)
+    return ranks
+
+
+def _bracket_slopes(xs, ys, lo_order, hi_order, size=None, rng=None, total=None):
+    # Pairs that swap between the two orders are the slopes in [lo, hi)
+    ranks = _ranks(hi_order)[lo_order]
+    first, second = _inverted_pairs(ranks, size, rng, total)
+    a = lo_order[first]
+    b = lo_order[second]
+    return (ys[b] - ys[a]) / (xs[b] - xs[a])
+
+
+def _random_slopes(xs, ys, size, rng):
+    # Uniform over all pairs with distinct x: the first bracket needs no walk
+    i = rng.integers(0, xs.size, size)
+    j = rng.integers(0, xs.size, size)
+    keep = xs[i] != xs[j]
+    i, j = i[keep], j[keep]
+    return (ys[j] - ys[i]) / (xs[j] - xs[i])
+
+
+def theil_sen_slope(x, y, sample_size=None, seed=0, max_rounds=64):
+    """Median of the pairwise slopes (pairs with equal x excluded) in O(n log n).
+
+    The median is selected by randomized bracketing, so ``seed`` only affects
+    the running time; when the slopes around the median are exact ties the
+    tied value is returned.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    order = np.lexsort((y, x))
+    xs, ys = x[order], y[order]
+    n = xs.size
+    _, tie_sizes = np.unique(xs, return_counts=True)
+    total = n * (n - 1) // 2 - int((tie_sizes * (tie_sizes - 1) // 2).sum())
+    if total == 0:
+        raise ValueError("Theil–Sen needs at least two distinct x values.")
+
+    rng = np.random.default_rng(seed)
+    sample_size = sample_size or max(4 * n, 1 << 12)
+    enumerate_limit = max(_ENUMERATE_PER_POINT * n, 1 << 16)
+    targets = ((total - 1) // 2, total // 2)
+
+    # The bracket [lo, hi) holds the slopes ranked lo_count .. hi_count - 1
+    lo_order, lo_count = np.arange(n), 0
+    hi_order, hi_count = np.argsort(-xs, kind="stable"), total
+    for _ in range(max_rounds):
+        bracket = hi_count - lo_count
+        if bracket <= enumerate_limit:
+            slopes = _bracket_slopes(xs, ys, lo_order, hi_order)
+            slopes.sort()
+            picks = [slopes[min(max(k - lo_count, 0), slopes.size - 1)] for k in targets]
+            return float(0.5 * (picks[0] + picks[1]))
+
+        if bracket == total:
+            sample = _random_slopes(xs, ys, sample_size, rng)
+        else:
+            sample = _bracket_slopes(xs, ys, lo_order, hi_order, sample_size, rng, bracket)
+        sample.sort()
+        m = sample.size
+        # Quantiles a few standard errors either side of the wanted ranks
+        margin = 2.0 / np.sqrt(m)
+        low_q = (targets[0] - lo_count) / bracket - margin
+        high_q = (targets[1] - lo_count + 1) / bracket + margin
+        t_lo = sample[int(low_q * m)] if low_q > 0 else None
+        t_hi = sample[min(int(np.ceil(high_q * m)), m - 1)] if high_q < 1 else None
+        if t_lo is not None and t_hi is not None and t_lo == t_hi:
+            return float(t_lo)
+
+        progress = False
+        if t_lo is not None:
+            order_lo = _order_at(xs, ys, t_lo)
+            count = count_inversions(_ranks(order_lo))
+            if lo_count < count <= targets[0]:
+                lo_order, lo_count, progress = order_lo, count, True
+        if t_hi is not None:
+            order_hi = _order_at(xs, ys, t_hi)
+            count = count_inversions(_ranks(order_hi))
+            if targets[1] < count < hi_count:
+                hi_order, hi_count, progress = order_hi, count, True
+        if not progress:
+            sample_size *= 4
+    # Rounding kept the bracket from closing; the sample median is within it
+    return float(np.median(sample))
+
+
+def theil_sen(x, y, **options):
+    """Theil–Sen line: median pairwise slope, intercept = median(y - slope·x)."""
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    slope = theil_sen_slope(x, y, **options)
+    intercept = float(np.median(y - slope * x))
+    residuals = y - (intercept + slope * x)
+    scale = _mad_scale(residuals)
+    inliers = int(np.count_nonzero(np.abs(residuals) <= _INLIER_SIGMAS * scale))
+    return RobustResult("theil-sen", x.size, slope, intercept, scale, inliers)
+
+
+def huber(x, y, epsilon=1.345, max_iter=50, tol=1e-10):
+    """Huber M-estimate by iteratively reweighted least squares.
+
+    Residuals beyond ``epsilon`` robust standard deviations get weight
+    ``epsilon·σ/|r|`` instead of 1; σ is re-estimated from the MAD each round.
+    Iteration starts from a Theil–Sen fit of a subsample.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    # Start from Theil–Sen on a subsample; least squares would already be dragged off
+    sample = np.random.default_rng(0).choice(x.size, size=min(x.size, _START_POINTS), replace=False)
+    start = theil_sen(x[sample], y[sample])
+    slope, intercept = start.slope, start.intercept
+    scale = 0.0
+    for _ in range(max_iter):
+        residuals = y - (intercept + slope * x)
+        scale = _mad_scale(residuals)
+        if scale == 0.0:
+            break
+        limit = epsilon * scale
+        # min(1, limit / |r|)
+        weights = limit / np.maximum(np.abs(residuals), limit)
+        # Weighted least squares in centred form
+        w_sum = weights.sum()
+        mean_x = np.dot(weights, x) / w_sum
+        mean_y = np.dot(weights, y) / w_sum
+        dx = x - mean_x
+        sxx = np.dot(weights, dx * dx)
+        new_slope = np.dot(weights, dx * (y - mean_y)) / sxx if sxx > 0 else 0.0
+        new_intercept = mean_y - new_slope * mean_x
+        done = (abs(new_slope - slope) <= tol * max(1.0, abs(slope))
+                and abs(new_intercept - intercept) <= tol * max(1.0, abs(intercept)))
+        slope, intercept = float(new_slope), float(new_intercept)
+        if done:
+            break
+    inliers = x.size
+    if scale:
+        inliers = int(np.count_nonzero(np.abs(y - (intercept + slope * x)) <= epsilon * scale))
+    return RobustResult("huber", x.size, slope, intercept, scale, inliers)
+
+
+def ransac(x, y, threshold=None, trials=1000, batch=250, score_points=_START_POINTS, seed=0):
+    """RANSAC line: the two-point candidate with most points within ``threshold``.
+
+    Candidates are generated and scored ``batch`` at a time as one
+    candidates × points array over a random subsample of ``score_points``
+    points; the winner's inliers on the full data are refitted by least
+    squares.  ``threshold`` defaults to 2.5 robust standard deviations of the
+    Theil–Sen residuals on the subsample.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    n = x.size
+    if n < 2:
+        raise ValueError("RANSAC needs at least two points.")
+    rng = np.random.default_rng(seed)
+    subset = rng.choice(n, size=min(n, score_points), replace=False)
+    x_sub, y_sub = x[subset], y[subset]
+    if threshold is None:
+        threshold = _INLIER_SIGMAS * theil_sen(x_sub, y_sub).scale
+        if threshold == 0.0:
+            # Exact data: accept points on the line up to rounding
+            threshold = 1e-9 * (1.0 + float(np.abs(y).max()))
+
+    best_score, best = -1, None
+    for start in range(0, trials, batch):
+        size = min(batch, trials - start)
+        i = rng.integers(0, n, size)
+        j = rng.integers(0, n, size)
+        dx = x[j] - x[i]
+        valid = dx != 0
+        if not valid.any():
+            continue
+        slopes = (y[j] - y[i])[valid] / dx[valid]
+        intercepts = y[i][valid] - slopes * x[i][valid]
+        residuals = np.abs(y_sub - (intercepts[:, None] + slopes[:, None] * x_sub))
+        scores = np.count_nonzero(residuals <= threshold, axis=1)
+        k = int(scores.argmax())
+        if scores[k] > best_score:
+            best_score, best = int(scores[k]), (slopes[k], intercepts[k])
+    if best is None:
+        raise ValueError("RANSAC needs at least two distinct x values.")
+
+    inliers = np.abs(y - (best[1] + best[0] * x)) <= threshold
+    slope, intercept = best
+    if np.count_nonzero(inliers) >= 2:
+        refit = fit(x[inliers], y[inliers], "centered")
+        slope, intercept = refit.slope, refit.intercept
+        inliers = np.abs(y - (intercept + slope * x)) <= threshold
+    residuals = y[inliers] - (intercept + slope * x[inliers])
+    scale = _mad_scale(residuals) if residuals.size else 0.0
+    return RobustResult("ransac", n, float(slope), float(intercept), scale,
+                        int(np.count_nonzero(inliers)))
+
+
+_FITTERS = {"theil-sen": theil_sen, "huber": huber, "ransac": ransac}
+
+
+def robust_fit(x, y, method="theil-sen", **options):
+    """Fit a line with one of ``ROBUST_METHODS``; options go to that estimator."""
+    if method not in _FITTERS:
+        raise ValueError(f"Unknown robust method {method!r}; expected one of {ROBUST_METHODS}")
+    if np.size(x) != np.size(y):
+        raise ValueError("x and y must have the same length.")
+    if np.size(x) == 0:
+        raise ValueError("No data points.")
+    return _FITTERS[method](x, y, **options)
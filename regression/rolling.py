@@ -0,0 +1,109 @@
+"""Sliding-window regression: slope, intercept and r of every w-point window.
+
+All windows together cost O(n).  Plain running sums would cancel badly once
+they grow much larger than one window's worth (timestamps as x, long series),
+so the prefix sums restart at every block of ``window`` points and are taken
+relative to the block's first point.  A window then spans the tail of one
+block and the head of the next, and its sums are two lookups plus a shift of
+the second part to the first block's anchor.
+"""
+
+from typing import NamedTuple
+
+import numpy as np
+
+ROLLING_COLUMNS = ("start", "x_end", "slope", "intercept", "r")
+
+
+class RollingResult(NamedTuple):
+    window: int
+    start: np.ndarray      # index of each window's first point
+    x_end: np.ndarray      # x of each window's last point, the time axis
+    slope: np.ndarray
+    intercept: np.ndarray
+    r: np.ndarray
+
+    def __len__(self):
+        return self.start.size
+
+    def save(self, path):
+        """Write the windows as ``.npz`` (one array per column) or CSV."""
+        columns = {name: getattr(self, name) for name in ROLLING_COLUMNS}
+        if path.lower().endswith(".npz"):
+            np.savez(path, window=self.window, **columns)
+        else:
+            np.savetxt(path, np.column_stack(list(columns.values())), delimiter=",",
+                       header=",".join(ROLLING_COLUMNS), comments="", fmt="%.17g")
+
+
+def _block_prefix_sums(dx, dy, window, blocks):
+    # (blocks, window + 1, 5) sums of dx, dy, dx², dy², dxdy restarting per block
+    sums = np.zeros((blocks, window + 1, 5))
+    values = np.zeros(blocks * window)
+    n = dx.size
+    for column, (a, b) in enumerate(((dx, None), (dy, None), (dx, dx), (dy, dy), (dx, dy))):
+        if b is None:
+            values[:n] = a
+        else:
+            np.multiply(a, b, out=values[:n])
+        np.cumsum(values.reshape(blocks, window), axis=1, out=sums[:, 1:, column])
+    return sums
+
+
+def rolling_fit(x, y, window, step=1):
+    """Fit y = a + bx in every window of ``window`` consecutive points.
+
+    Windows start every ``step`` points, in the order the data were given.
+    Windows whose x do not vary get slope 0 and r 0, as in :func:`fit`.
+    """
+    x = np.asarray(x, dtype=np.float64)
+    y = np.asarray(y, dtype=np.float64)
+    if x.shape != y.shape or x.ndim != 1:
+        raise ValueError("x and y must be one-dimensional arrays of equal length")
+    n = x.size
+    window = int(window)
+    if window < 2:
+        raise ValueError("The window needs at least two points.")
+    if window > n:
+        raise ValueError(f"The window of {window} points is longer than the data ({n} points).")
+
+    # One spare block so the last window's "next block" exists
+    blocks = n // window + 2
+    block_of = np.arange(n) // window
+    anchor_x = x[::window]
+    anchor_y = y[::window]
+    sums = _block_prefix_sums(x - anchor_x[block_of], y - anchor_y[block_of], window, blocks)
+
+    start = np.arange(0, n - window + 1, max(1, int(step)))
+    k = start // window
+    offset = start % window
+    # Tail of block k, relative to its anchor
+    tail = sums[k, window] - sums[k, offset]
+    # Head of block k + 1 (offset points), moved to block k's anchor
+    head = sums[k + 1, offset]
+    next_anchor_x = np.append(anchor_x, anchor_x[-1])[k + 1]
+    next_anchor_y = np.append(anchor_y, anchor_y[-1])[k + 1]
+    shift_x = next_anchor_x - anchor_x[k]
+    shift_y = next_anchor_y - anchor_y[k]
+    count = offset.astype(np.float64)
+    head_x = head[:, 0] + count * shift_x
+    head_y = head[:, 1] + count * shift_y
+    head_xx = head[:, 2] + 2 * shift_x * head[:, 0] + count * shift_x * shift_x
+    head_yy = head[:, 3] + 2 * shift_y * head[:, 1] + count * shift_y * shift_y
+    head_xy = head[:, 4] + shift_x * head[:, 1] + shift_y * head[:, 0] + count * shift_x * shift_y
+
+    sum_x = tail[:, 0] + head_x
+    sum_y = tail[:, 1] + head_y
+    # Centred sums of the window
+    sxx = tail[:, 2] + head_xx - sum_x * sum_x / window
+    syy = tail[:, 3] + head_yy - sum_y * sum_y / window
+    sxy = tail[:, 4] + head_xy - sum_x * sum_y / window
+
+    with np.errstate(divide="ignore", invalid="ignore"):
+        slope = np.where(sxx > 0, sxy / sxx, 0.0)
+        r_denominator = sxx * syy
+        r = np.where(r_denominator > 0, sxy / np.sqrt(r_denominator), 0.0)
+    mean_x = anchor_x[k] + sum_x / window
+    mean_y = anchor_y[k] + sum_y / window
+    intercept = mean_y - slope * mean_x
+    return RollingResult(window, start, x[start + window - 1], slope, intercept, r)
@@ -0,0 +1,87 @@
+"""Incremental least-squares fit for (x, y) points that arrive over time.
+
+The accumulator keeps only the count, the means and the centred second
+moments (Welford's update), so each point costs O(1) time and the state never
+grows.  Chunks are folded in with Chan's pairwise combination, and points can
+be removed again to maintain a sliding window.
+"""
+
+import numpy as np
+
+from .engine import combine_moments, result_from_moments
+
+
+class OnlineRegression:
+    """Running fit of y = a + bx updated one point or one chunk at a time."""
+
+    __slots__ = ("n", "mean_x", "mean_y", "m2_x", "m2_y", "c_xy")
+
+    def __init__(self):
+        self.reset()
+
+    def reset(self):
+        self.n = 0
+        self.mean_x = 0.0
+        self.mean_y = 0.0
+        self.m2_x = 0.0   # Σ(x - x̄)²
+        self.m2_y = 0.0   # Σ(y - ȳ)²
+        self.c_xy = 0.0   # Σ(x - x̄)(y - ȳ)
+
+    def add(self, x, y):
+        """Add a single point."""
+        self.n += 1
+        dx = x - self.mean_x
+        self.mean_x += dx / self.n
+        dy = y - self.mean_y
+        self.mean_y += dy / self.n
+        # Mixing the old and new deviations keeps every term exact
+        self.m2_x += dx * (x - self.mean_x)
+        self.m2_y += dy * (y - self.mean_y)
+        self.c_xy += dx * (y - self.mean_y)
+
+    def remove(self, x, y):
+        """Remove a point that was previously added (e.g. leaving a window)."""
+        if self.n <= 1:
+            self.reset()
+            return
+        dx = x - self.mean_x
+        dy = y - self.mean_y
+        self.n -= 1
+        self.mean_x -= dx / self.n
+        self.mean_y -= dy / self.n
+        self.m2_x -= dx * (x - self.mean_x)
+        self.m2_y -= dy * (y - self.mean_y)
+        self.c_xy -= dx * (y - self.mean_y)
+
+    def add_many(self, x, y):
+        """Add a chunk of points given as two equal-length arrays."""
+        x = np.asarray(x, dtype=np.float64)
+        y = np.asarray(y, dtype=np.float64)
+        if x.shape != y.shape:
+            raise ValueError("x and y must have the same length")
+        if x.size == 0:
+            return
+        mean_x = float(x.mean())
+        mean_y = float(y.mean())
+        dx = x - mean_x
+        dy = y - mean_y
+        self._combine(x.size, mean_x, mean_y,
+                      float(np.dot(dx, dx)), float(np.dot(dy, dy)), float(np.dot(dx, dy)))
+
+    def merge(self, other):
+        """Fold another accumulator into this one."""
+        self._combine(*other._moments())
+
+    def _combine(self, *moments):
+        (self.n, self.mean_x, self.mean_y,
+         self.m2_x, self.m2_y, self.c_xy) = combine_moments(self._moments(), moments)
+
+    def _moments(self):
+        return self.n, self.mean_x, self.mean_y, self.m2_x, self.m2_y, self.c_xy
+
+    def result(self):
+        """Return the current fit in the same form as :func:`regression.fit`."""
+        return result_from_moments(*self._moments())
+
+    def __len__(self):
+        return self.n
@@ -0,0 +1,228 @@
+"""Sufficient statistics that can be saved, reloaded and merged exactly.
+
+A least-squares line depends on the data only through n, the means x̄ and ȳ
+and the centred sums Sxx = Σ(x-x̄)², Syy = Σ(y-ȳ)² and Sxy = Σ(x-x̄)(y-ȳ)
+(or, for a polynomial or several predictors, XᵀX, Xᵀy and yᵀy).
+Partitions fitted on different runs or machines combine into the global fit
+with Chan et al.'s pairwise update, as in
+:class:`~regression.streaming.OnlineRegression`; the raw data never has to be
+re-read.  Raw sums such as Σx² would be additive too, but recovering Sxx
+from them cancels catastrophically once x sits far from zero (timestamps),
+so they are not what is stored.  Polynomial cross-products are kept in the
+fit's scaled variable t and re-expressed in a common t before merging.
+
+Two file formats are supported, chosen by extension: ``.json`` (portable and
+readable; floats round-trip exactly) and ``.npz`` (compact binary).
+"""
+
+import json
+
+import numpy as np
+
+from .engine import centered_moments, combine_moments, result_from_moments
+from .multiple import (CrossProducts, polynomial_basis, polynomial_cross_products,
+                       rebase_polynomial)
+
+FORMAT = "regression-summary"
+FORMAT_VERSION = 2
+_MOMENT_FIELDS = ("n", "mean_x", "mean_y", "sxx", "syy", "sxy")
+_SUM_FIELDS = ("n", "sum_x", "sum_y", "sum_x2", "sum_y2", "sum_xy")
+
+
+class SufficientStats:
+    """Mergeable n, x̄, ȳ, Sxx, Syy, Sxy plus optional cross-products.
+
+    ``basis`` is ``(center, scale)`` when the cross-products are those of a
+    polynomial in t = (x - center) / scale (see
+    :func:`~regression.fit_polynomial`), and None for other predictors.
+    """
+
+    def __init__(self, n=0, mean_x=0.0, mean_y=0.0, sxx=0.0, syy=0.0, sxy=0.0,
+                 cross_products=None, basis=None):
+        self.n = int(n)
+        self.mean_x = float(mean_x)
+        self.mean_y = float(mean_y)
+        self.sxx = float(sxx)
+        self.syy = float(syy)
+        self.sxy = float(sxy)
+        self.cross_products = cross_products
+        self.basis = basis
+
+    @classmethod
+    def from_arrays(cls, x, y, degree=1):
+        """Statistics of ``x`` and ``y``; with ``degree`` > 1 also the
+        cross-products of that polynomial, in the basis :func:`fit_polynomial` uses."""
+        x = np.ascontiguousarray(x, dtype=np.float64)
+        y = np.ascontiguousarray(y, dtype=np.float64)
+        if x.shape != y.shape or x.ndim != 1:
+            raise ValueError("x and y must be one-dimensional arrays of equal length")
+        if x.size == 0:
+            return cls()
+        stats = cls(*centered_moments(x, y))
+        if degree > 1:
+            stats.basis = polynomial_basis(x)
+            stats.cross_products = polynomial_cross_products(x, y, degree, *stats.basis)
+        return stats
+
+    @classmethod
+    def from_accumulator(cls, acc):
+        """Take the moments of an :class:`~regression.OnlineRegression`."""
+        return cls(acc.n, acc.mean_x, acc.mean_y, acc.m2_x, acc.m2_y, acc.c_xy)
+
+    @classmethod
+    def from_sums(cls, n, sum_x, sum_y, sum_x2, sum_y2, sum_xy):
+        """Convert raw sums; only as accurate as Σx² - (Σx)²/n and the like."""
+        if n == 0:
+            return cls()
+        mean_x = sum_x / n
+        mean_y = sum_y / n
+        return cls(n, mean_x, mean_y, sum_x2 - sum_x * mean_x, sum_y2 - sum_y * mean_y,
+                   sum_xy - sum_x * mean_y)
+
+    @classmethod
+    def from_result(cls, result):
+        """Take the raw sums out of a :class:`~regression.RegressionResult`.
+
+        Prefer :meth:`from_arrays` when the data are at hand; see :meth:`from_sums`.
+        """
+        return cls.from_sums(*(getattr(result, name) for name in _SUM_FIELDS))
+
+    def moments(self):
+        return tuple(getattr(self, name) for name in _MOMENT_FIELDS)
+
+    def result(self):
+        """The simple y = a + bx fit these statistics describe."""
+        return result_from_moments(*self.moments())
+
+    def merge(self, other):
+        """Add ``other`` into these statistics in place and return self.
+
+        Cross-products survive only if both sides carry them (or one side is
+        empty); otherwise they would describe just part of the data.
+        Polynomial cross-products in different bases are first re-expressed
+        in one basis spanning both.
+        """
+        if other.n == 0:
+            return self
+        if self.n == 0:
+            if other.cross_products is not None:
+                self.cross_products = CrossProducts(other.cross_products.k)
+                self.cross_products.merge(other.cross_products)
+                self.basis = other.basis
+        elif self.cross_products is not None and other.cross_products is not None:
+            self._merge_cross_products(other)
+        else:
+            self.cross_products = None
+            self.basis = None
+        (self.n, self.mean_x, self.mean_y,
+         self.sxx, self.syy, self.sxy) = combine_moments(self.moments(), other.moments())
+        return self
+
+    def _merge_cross_products(self, other):
+        if (self.basis is None) != (other.basis is None):
+            raise ValueError("Cannot merge polynomial cross-products with other predictors")
+        theirs = other.cross_products
+        if self.basis is not None and self.basis != other.basis:
+            # The range covered by both, mapped onto [-1, 1] as fit_polynomial does
+            low = min(self.basis[0] - self.basis[1], other.basis[0] - other.basis[1])
+            high = max(self.basis[0] + self.basis[1], other.basis[0] + other.basis[1])
+            basis = polynomial_basis(np.array([low, high]))
+            self.cross_products = rebase_polynomial(self.cross_products, *self.basis, *basis)
+            theirs = rebase_polynomial(theirs, *other.basis, *basis)
+            self.basis = basis
+        self.cross_products.merge(theirs)
+
+    def __add__(self, other):
+        return SufficientStats().merge(self).merge(other)
+
+    def to_dict(self):
+        data = {"format": FORMAT, "version": FORMAT_VERSION}
+        data.update((name, getattr(self, name)) for name in _MOMENT_FIELDS)
+        cp = self.cross_products
+        if cp is not None:
+            data["cross_products"] = {
+                "k": cp.k,
+                "n": cp.n,
+                "shift": cp.shift.tolist(),
+                "y_shift": cp.y_shift,
+                "xtx": cp.xtx.tolist(),
+                "xty": cp.xty.tolist(),
+                "yty": cp.yty,
+            }
+            if self.basis is not None:
+                data["basis"] = list(self.basis)
+        return data
+
+    @classmethod
+    def from_dict(cls, data):
+        if data.get("format") != FORMAT:
+            raise ValueError("Not a regression summary file")
+        if data.get("version") != FORMAT_VERSION:
+            raise ValueError(f"Unsupported regression summary version {data.get('version')}")
+        stats = cls(*(data[name] for name in _MOMENT_FIELDS))
+        cp_data = data.get("cross_products")
+        if cp_data is not None:
+            cp = CrossProducts(int(cp_data["k"]))
+            cp.n = int(cp_data["n"])
+            cp.shift = np.asarray(cp_data["shift"], dtype=np.float64)
+            cp.y_shift = float(cp_data["y_shift"])
+            cp.xtx = np.asarray(cp_data["xtx"], dtype=np.float64)
+            cp.xty = np.asarray(cp_data["xty"], dtype=np.float64)
+            cp.yty = float(cp_data["yty"])
+            stats.cross_products = cp
+            if "basis" in data:
+                stats.basis = tuple(float(v) for v in data["basis"])
+        return stats
+
+    def save(self, path):
+        """Write to ``path``; ``.npz`` is binary, anything else JSON."""
+        if path.lower().endswith(".npz"):
+            arrays = {"header": np.array([FORMAT, str(FORMAT_VERSION)]),
+                      "moments": np.array(self.moments()[1:], dtype=np.float64),
+                      "n": np.array(self.n, dtype=np.int64)}
+            cp = self.cross_products
+            if cp is not None:
+                arrays.update(cp_n=np.array(cp.n, dtype=np.int64), cp_shift=cp.shift,
+                              cp_y_shift=np.array(cp.y_shift), cp_xtx=cp.xtx,
+                              cp_xty=cp.xty, cp_yty=np.array(cp.yty))
+                if self.basis is not None:
+                    arrays["basis"] = np.array(self.basis, dtype=np.float64)
+            np.savez(path, **arrays)
+        else:
+            with open(path, "w", encoding="utf-8") as f:
+                json.dump(self.to_dict(), f, indent=2)
+                f.write("\n")
+
+    @classmethod
+    def load(cls, path):
+        if path.lower().endswith(".npz"):
+            with np.load(path, allow_pickle=False) as data:
+                header = data["header"]
+                if header[0] != FORMAT:
+                    raise ValueError("Not a regression summary file")
+                if int(header[1]) != FORMAT_VERSION:
+                    raise ValueError(f"Unsupported regression summary version {header[1]}")
+                stats = cls(int(data["n"]), *data["moments"].tolist())
+                if "cp_xtx" in data:
+                    cp = CrossProducts(data["cp_xtx"].shape[0] - 1)
+                    cp.n = int(data["cp_n"])
+                    cp.shift = data["cp_shift"].copy()
+                    cp.y_shift = float(data["cp_y_shift"])
+                    cp.xtx = data["cp_xtx"].copy()
+                    cp.xty = data["cp_xty"].copy()
+                    cp.yty = float(data["cp_yty"])
+                    stats.cross_products = cp
+                    if "basis" in data:
+                        stats.basis = tuple(data["basis"].tolist())
+            return stats
+        with open(path, encoding="utf-8") as f:
+            return cls.from_dict(json.load(f))
+
+
+def merge_summaries(paths):
+    """Load and merge every summary file in ``paths``."""
+    total = SufficientStats()
+    for path in paths:
+        total.merge(SufficientStats.load(path))
+    return total
+
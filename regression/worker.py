@@ -0,0 +1,86 @@
+"""Run analyses off the GUI thread.
+
+Tk widgets may only be touched from the thread running ``mainloop``, so the
+worker never calls back into the GUI directly.  It posts messages to a queue
+that the GUI drains from a ``root.after`` timer via :meth:`BackgroundRunner.poll`.
+Submitting a new job cancels the previous one; anything a stale job still
+manages to post is dropped.  A runner created with ``exclusive=False`` (used
+for exports) lets jobs run side by side and delivers all of their results.
+"""
+
+import queue
+import threading
+
+
+class Cancelled(Exception):
+    """Raised inside a job when a newer submission superseded it."""
+
+
+class BackgroundRunner:
+    """Background job runner with cancellation and progress, single-slot unless ``exclusive=False``."""
+
+    def __init__(self, exclusive=True):
+        self.exclusive = exclusive
+        self._messages = queue.Queue()
+        self._generation = 0
+        self._cancel = None
+
+    @property
+    def busy(self):
+        return self._cancel is not None
+
+    def submit(self, job, *args, on_done, on_error, on_progress=None):
+        """Start ``job(*args, report=...)`` on a worker thread.
+
+        ``report(fraction)`` publishes progress and raises :class:`Cancelled`
+        once the job is stale.  The callbacks run on whichever thread calls
+        :meth:`poll`.
+        """
+        if self.exclusive:
+            self.cancel()
+        self._generation += 1
+        generation = self._generation
+        cancel = self._cancel = threading.Event()
+        callbacks = (on_done, on_error, on_progress)
+
+        def report(fraction):
+            if cancel.is_set():
+                raise Cancelled()
+            self._messages.put((generation, callbacks, "progress", fraction))
+
+        def run():
+            try:
+                result = job(*args, report=report)
+            except Cancelled:
+                return
+            except Exception as e:
+                self._messages.put((generation, callbacks, "error", e))
+            else:
+                self._messages.put((generation, callbacks, "done", result))
+
+        threading.Thread(target=run, daemon=True).start()
+
+    def cancel(self):
+        if self._cancel is not None:
+            self._cancel.set()
+            self._cancel = None
+
+    def poll(self):
+        """Deliver pending messages of the current job; call from the GUI thread."""
+        while True:
+            try:
+                generation, (on_done, on_error, on_progress), kind, value = self._messages.get_nowait()
+            except queue.Empty:
+                return
+            if self.exclusive and generation != self._generation:
+                continue
+            if kind == "progress":
+                if on_progress is not None:
+                    on_progress(value)
+                continue
+            if generation == self._generation:
+                self._cancel = None
+            if kind == "done":
+                on_done(value)
+            else:
+                on_error(value)